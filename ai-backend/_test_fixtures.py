@@ -0,0 +1,357 @@
+"""Shared models, validators and fixtures for the document check scripts.
+
+Importing this module puts the backend on sys.path once, so the scripts share one
+set of compiled adapters when collected together under pytest.
+"""
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
+# Add the backend directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.models.outputs import ProjectBriefOutput, QuotationOutput, TaxInvoiceOutput
+
+# Adapters are built once so each validation reuses the compiled validator
+QUOTE_ADAPTER = TypeAdapter(QuotationOutput)
+INVOICE_ADAPTER = TypeAdapter(TaxInvoiceOutput)
+BRIEF_ADAPTER = TypeAdapter(ProjectBriefOutput)
+
+@dataclass(slots=True, frozen=True)
+class MilestoneRow:
+    """Legacy start/end milestone row used by the project-brief fixtures."""
+
+    name: str
+    start: str
+    end: str
+    fee: float
+
+
+@dataclass(slots=True, frozen=True)
+class BillingRow:
+    """Legacy when/percent billing row used by the project-brief fixtures."""
+
+    when: str
+    percent: int
+
+
+# Read-only fixtures, each also encoded once so pydantic parses and validates it in a single pass
+
+QUOTATION_FIXTURE = MappingProxyType(
+    {
+        "doc_type": "QUOTATION",
+        "currency": "INR",
+        "locale": "en-IN",
+        "seller": {
+            "name": "Tech Solutions Pvt Ltd",
+            "address": "123 Tech Street, Bangalore",
+            "gstin": "29ABCDE1234F1Z5",
+            "email": "sales@techsolutions.com"
+        },
+        "buyer": {
+            "name": "Client Corp",
+            "address": "456 Business Ave, Mumbai"
+        },
+        "dates": {
+            "issue_date": "2025-11-04",
+            "valid_till": "2025-11-18"
+        },
+        "items": [
+            {
+                "description": "Website Development",
+                "hsn_sac": "998314",
+                "qty": 1,
+                "unit": "project",
+                "unit_price": 50000,
+                "discount": 0,
+                "tax_rate": 18
+            }
+        ],
+        "totals": {
+            "subtotal": 50000,
+            "discount_total": 0,
+            "tax_total": 9000,
+            "shipping": 0,
+            "round_off": 0,
+            "grand_total": 59000,
+            "amount_in_words": "Fifty Nine Thousand Rupees Only"
+        },
+        "terms": {
+            "title": "Terms & Conditions",
+            "bullets": [
+                "Payment within 15 days",
+                "50% advance required"
+            ]
+        }
+    }
+)
+QUOTATION_JSON = orjson.dumps(dict(QUOTATION_FIXTURE))
+
+INVOICE_FIXTURE = MappingProxyType(
+    {
+        "doc_type": "TAX_INVOICE",
+        "currency": "INR",
+        "locale": "en-IN",
+        "seller": {
+            "name": "Tech Solutions Pvt Ltd",
+            "address": "123 Tech Street, Bangalore, Karnataka",
+            "gstin": "29ABCDE1234F1Z5",
+            "email": "sales@techsolutions.com"
+        },
+        "buyer": {
+            "name": "Client Corp",
+            "address": "456 Business Ave, Mumbai, Maharashtra",
+            "gstin": "27XYZAB5678G1H9"
+        },
+        "doc_meta": {
+            "doc_no": "INV-2025-001"
+        },
+        "dates": {
+            "issue_date": "2025-11-04",
+            "due_date": "2025-11-19"
+        },
+        "items": [
+            {
+                "description": "Website Development Services",
+                "hsn_sac": "998314",
+                "qty": 1,
+                "unit": "project",
+                "unit_price": 50000,
+                "discount": 0,
+                "tax_rate": 18
+            }
+        ],
+        "totals": {
+            "subtotal": 50000,
+            "discount_total": 0,
+            "tax_total": 9000,
+            "shipping": 0,
+            "round_off": 0,
+            "grand_total": 59000,
+            "amount_in_words": "Fifty Nine Thousand Rupees Only"
+        },
+        "terms": {
+            "title": "Terms & Conditions",
+            "bullets": [
+                "Payment due within 15 days",
+                "Late payment attracts 2% interest per month"
+            ]
+        },
+        "gst": {
+            "mode": "INTER",
+            "igst": 9000,
+            "cgst": 0,
+            "sgst": 0,
+            "place_of_supply": "Maharashtra"
+        }
+    }
+)
+INVOICE_JSON = orjson.dumps(dict(INVOICE_FIXTURE))
+
+BRIEF_FIXTURE = MappingProxyType(
+    {
+        "title": "E-commerce Platform Development",
+        "objective": "Build a modern e-commerce platform with payment integration",
+        "scope": [
+            "UI/UX design",
+            "Frontend development (React)",
+            "Backend API (Node.js)",
+            "Payment gateway integration"
+        ],
+        "deliverables": [
+            "Design mockups",
+            "Developed application",
+            "Documentation",
+            "Deployment"
+        ],
+        "milestones": (
+            MilestoneRow("Design Phase", "2025-11-04", "2025-11-18", 0.0),
+            MilestoneRow("Development Phase", "2025-11-18", "2025-12-18", 0.0),
+            MilestoneRow("Testing & Deployment", "2025-12-18", "2026-01-03", 0.0),
+        ),
+        "timeline_days": 60,
+        "billing_plan": (
+            BillingRow("Project Start", 30),
+            BillingRow("Design Approval", 30),
+            BillingRow("Go-Live", 40),
+        ),
+        "risks": [
+            {
+                "description": "Delay in content and product data provision by client",
+                "impact": "Medium",
+                "probability": "High",
+                "mitigation": "Allocate buffer time in schedule, provide content guidelines early"
+            },
+            {
+                "description": "Payment gateway integration challenges",
+                "impact": "High",
+                "probability": "Medium",
+                "mitigation": "Early technical assessment, backup payment provider"
+            }
+        ]
+    }
+)
+BRIEF_JSON = orjson.dumps(dict(BRIEF_FIXTURE))
+
+# This is the exact format the AI is generating based on the error logs
+AI_FORMAT_FIXTURE = MappingProxyType(
+    {
+        "title": "E-commerce Platform Development",
+        "objective": "Build a modern e-commerce platform",
+        "scope": [
+            "UI/UX design",
+            "Frontend development",
+            "Backend API"
+        ],
+        "deliverables": [
+            "Design mockups",
+            "Developed application",
+            "Documentation"
+        ],
+        "milestones": (
+            MilestoneRow("Discovery & Planning", "2025-11-04", "2025-11-11", 0.0),
+            MilestoneRow("UX Research & Wireframes", "2025-11-11", "2025-11-18", 0.0),
+            MilestoneRow("UI Design Approval", "2025-11-18", "2025-11-25", 0.0),
+        ),
+        "timeline_days": 60,
+        "billing_plan": (
+            BillingRow("Milestone 1", 20),
+            BillingRow("Milestone 2", 20),
+            BillingRow("Milestone 3", 20),
+            BillingRow("Milestone 4", 20),
+            BillingRow("Milestone 5", 20),
+        ),
+        "risks": [
+            {
+                "description": "Delay in content provision",
+                "impact": "Medium",
+                "probability": "High",
+                "mitigation": "Allocate buffer time in schedule"
+            }
+        ]
+    }
+)
+AI_FORMAT_JSON = orjson.dumps(dict(AI_FORMAT_FIXTURE))
+
+# Sample data matching what the AI generates
+NEW_FORMAT_FIXTURE = MappingProxyType(
+    {
+        "title": "E-commerce Platform Development",
+        "objective": "Build a modern e-commerce platform",
+        "scope": {
+            "in_scope": [
+                "UI/UX design",
+                "Frontend development",
+                "Backend API"
+            ],
+            "out_of_scope": [
+                "Content creation",
+                "Marketing"
+            ],
+            "assumptions": [
+                "Client provides product data"
+            ],
+            "dependencies": [
+                "Third-party payment gateway"
+            ]
+        },
+        "deliverables": [
+            {
+                "name": "Design Mockups",
+                "description": "Complete UI/UX designs",
+                "format": "Figma files",
+                "acceptance_criteria": "Approved by stakeholder"
+            }
+        ],
+        "milestones": [
+            {
+                "name": "Design Approval",
+                "description": "UI/UX designs approved",
+                "days_from_start": 15,
+                "dependencies": []
+            }
+        ],
+        "timeline_days": 60,
+        "billing_plan": [
+            {
+                "milestone": "Project Kickoff",
+                "percentage": 30,
+                "description": "Advance payment"
+            },
+            {
+                "milestone": "Go-Live",
+                "percentage": 70,
+                "description": "Final payment"
+            }
+        ],
+        "risks": [
+            {
+                "description": "Delay in content provision",
+                "impact": "Medium",
+                "probability": "High",
+                "mitigation": "Allocate buffer time in schedule"
+            }
+        ],
+        "commercial_terms": {
+            "payment_terms": "As per billing plan",
+            "payment_methods": "Bank transfer, UPI",
+            "ip_rights": "All deliverables become client property"
+        }
+    }
+)
+NEW_FORMAT_JSON = orjson.dumps(dict(NEW_FORMAT_FIXTURE))
+
+# Sample data in old format (arrays of strings)
+LEGACY_FORMAT_FIXTURE = MappingProxyType(
+    {
+        "title": "Website Development",
+        "objective": "Build a website",
+        "scope": [
+            "Design",
+            "Development",
+            "Testing"
+        ],
+        "deliverables": [
+            "Website design",
+            "Developed website",
+            "Documentation"
+        ],
+        "milestones": [
+            {
+                "name": "Design Complete",
+                "days_from_start": 10
+            }
+        ],
+        "timeline_days": 30,
+        "billing_plan": [
+            {
+                "milestone": "Start",
+                "percentage": 50
+            },
+            {
+                "milestone": "End",
+                "percentage": 50
+            }
+        ],
+        "risks": [
+            "Delay in approvals",
+            "Technical challenges"
+        ]
+    }
+)
+LEGACY_FORMAT_JSON = orjson.dumps(dict(LEGACY_FORMAT_FIXTURE))
+
+
+def error_lines(exc):
+    """Report lines for a failed check; pydantic errors are listed without input, context or URLs."""
+    if isinstance(exc, ValidationError):
+        return [
+            f"   Error: {'.'.join(map(str, err['loc'])) or '<root>'}: {err['msg']}"
+            for err in exc.errors(include_url=False, include_context=False, include_input=False)
+        ]
+    return [f"   Error: {exc}"]
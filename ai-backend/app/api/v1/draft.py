@@ -50,7 +50,7 @@ async def create_draft(
 
     provider = provider_service.get_provider(selection.provider)
 
-    bundle = await drafting_service.generate_bundle(
+    bundle = await drafting_service.generate_bundle_parallel(
         provider=provider,
         model=selection.model,
         requirement=payload.prompt,
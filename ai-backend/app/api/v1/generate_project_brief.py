@@ -12,7 +12,7 @@ from ...api.errors import APIError
 from ...core.logging import get_logger
 from ...models.generation import GenerationRequest
 from ...models.outputs import ProjectBriefOutput
-from ...prompts.prompt import build_project_brief_prompt
+from ...prompts.prompt import build_project_brief_prompt, response_format_for
 from ...providers.base import PromptPacket
 from ...services.output_processing import build_project_brief_output
 from ...services.provider_service import ProviderService
@@ -47,15 +47,7 @@ async def generate_project_brief(
         )
 
     system_prompt, user_prompt, schema = build_project_brief_prompt(payload)
-    response_format = None
-    capabilities = provider.capabilities()
-    if capabilities.supports_json_schema:
-        response_format = {
-            "type": "json_schema",
-            "json_schema": {"name": schema.get("title", "ProjectBriefOutput"), "schema": schema},
-        }
-    elif capabilities.supports_plain_json:
-        response_format = {"type": "json_object"}
+    response_format = response_format_for(schema, provider.capabilities(), "ProjectBriefOutput")
 
     packet = PromptPacket(
         system_prompt=system_prompt,
@@ -67,7 +59,7 @@ async def generate_project_brief(
 
     start = time.perf_counter()
     try:
-        result = await provider.generate(packet)
+        result = await provider.generate_bounded(packet)
     except Exception as exc:  # pragma: no cover
         request_id = getattr(request.state, "request_id", "unknown")
         logger.error(
@@ -83,7 +75,10 @@ async def generate_project_brief(
     latency_ms = int((time.perf_counter() - start) * 1000)
 
     try:
-        raw_payload = extract_json(result.content)
+        if result.parsed is not None:
+            raw_payload = result.parsed
+        else:
+            raw_payload = extract_json(result.content)
     except ValueError as exc:
         request_id = getattr(request.state, "request_id", "unknown")
         logger.warning(
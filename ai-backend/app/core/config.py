@@ -5,6 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Optional
 
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,6 +26,12 @@ class Settings(BaseSettings):
     google_api_key: Optional[str] = None
 
     rate_limit_per_minute: int = 5
+    models_cache_ttl_seconds: float = 900.0
+    models_cache_dir: str = "~/.brief2bill/cache/models"
+    disable_model_cache: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("B2B_DISABLE_MODEL_CACHE", "disable_model_cache"),
+    )
 
     api_key: Optional[str] = None
     log_level: str = "INFO"
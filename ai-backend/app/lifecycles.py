@@ -14,6 +14,13 @@ from .services.provider_service import ProviderService
 from .services.validation import ValidationService
 from .services.drafting_service import DraftingService
 
+try:  # HTTP/2 needs the optional h2 package (installed via httpx[http2])
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
 logger = get_logger(__name__)
 
 
@@ -22,7 +29,13 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     logger.info("application_startup")
 
-    http_client = httpx.AsyncClient(timeout=httpx.Timeout(30.0))
+    # One pooled client shared by every provider; HTTP/2 lets concurrent calls share a connection.
+    # The lifespan owns it, so providers must never close it themselves.
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        http2=_HTTP2_AVAILABLE,
+    )
     app.state.http_client = http_client
 
     provider_service = ProviderService(settings=settings, http_client=http_client)
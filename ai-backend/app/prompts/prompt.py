@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ..models.generation import GenerationRequest
+from ..providers.base import ProviderCapabilities
 
 _SYSTEM_PROMPT = """You are an expert commercial document drafter specializing in Indian business documentation with deep knowledge of GST regulations, commercial practices, and legal requirements for Indian SMEs.
 
@@ -408,11 +410,40 @@ Return a single JSON object strictly obeying project_brief_output.schema.json. N
 _SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas" / "outputs"
 
 
+# response_format dicts keyed by schema identity and capabilities; schemas are cached for the process
+_RESPONSE_FORMATS: Dict[Tuple[int, str, bool, bool], Optional[Dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=None)
 def _load_schema(filename: str) -> Dict[str, Any]:
+    """Load an output schema once; the returned dict is shared and must not be mutated."""
     with (_SCHEMA_DIR / filename).open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
+def response_format_for(
+    schema: Dict[str, Any], capabilities: ProviderCapabilities, default_name: str
+) -> Optional[Dict[str, Any]]:
+    """Return the shared response_format for a schema given provider capabilities."""
+
+    key = (id(schema), default_name, capabilities.supports_json_schema, capabilities.supports_plain_json)
+    try:
+        return _RESPONSE_FORMATS[key]
+    except KeyError:
+        pass
+
+    response_format = None
+    if capabilities.supports_json_schema:
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": schema.get("title", default_name), "schema": schema},
+        }
+    elif capabilities.supports_plain_json:
+        response_format = {"type": "json_object"}
+    _RESPONSE_FORMATS[key] = response_format
+    return response_format
+
+
 def _json_dump(data: Any) -> str:
     """Serialize data to JSON, handling date/datetime objects."""
 
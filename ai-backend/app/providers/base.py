@@ -1,20 +1,35 @@
 """LLMProvider base classes and models"""
+import asyncio
+import json
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
+import orjson
 from pydantic import BaseModel
 
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Minimum number of seconds between repeated model-listing warnings per provider.
+_LIST_MODELS_WARN_INTERVAL = 300.0
+_last_list_models_warning: Dict[str, float] = {}
+
 
 class PromptPacket(BaseModel):
     """Input payload forwarded to an LLM provider"""
 
     system_prompt: str
     user_prompt: str
+    # Optional structured system content (e.g. with cache_control) used in place of system_prompt
+    system_blocks: Optional[List[Dict[str, Any]]] = None
     model: str
     temperature: float = 0.2
     response_format: Optional[Dict[str, Any]] = None
+    # Pre-serialised response_format; when set, providers splice it into the body as-is
+    response_format_json: Optional[bytes] = None
     tools: Optional[List[Dict[str, Any]]] = None
     tool_choice: Optional[Dict[str, Any]] = None
 
@@ -24,6 +39,8 @@ class LLMRawResponse(BaseModel):
     content: str
     model: str
     provider: str
+    # Structured output already decoded by the provider; content is empty when set
+    parsed: Optional[Dict[str, Any]] = None
     finish_reason: Optional[str] = None
     usage: Optional[Dict[str, Any]] = None  # Can contain nested dicts in newer APIs
 
@@ -37,18 +54,32 @@ class ModelDescriptor(BaseModel):
     notes: Optional[str] = None
 
 
+class FallbackModelList(list):
+    """Static model catalogue returned when a live listing fails; callers must not cache it"""
+
+
 class ProviderCapabilities(BaseModel):
     """Provider capability flags"""
     supports_json_schema: bool = False
     supports_function_call: bool = False
     supports_plain_json: bool = True
+    supports_prompt_cache: bool = False
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
 
+    # Upper bound on in-flight generate calls made through generate_bounded
+    max_concurrency: int = 4
+
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def generate_bounded(self, prompt: PromptPacket) -> LLMRawResponse:
+        """Generate a completion while respecting the provider's concurrency limit"""
+        async with self._semaphore:
+            return await self.generate(prompt)
 
     @abstractmethod
     async def generate(self, prompt: PromptPacket) -> LLMRawResponse:
@@ -62,5 +93,88 @@ class LLMProvider(ABC):
 
     @abstractmethod
     async def list_models(self) -> List[ModelDescriptor]:
-        """List available models"""
+        """List available models in display order"""
         raise NotImplementedError()
+
+
+def message_json_payload(message_content: Any) -> Optional[Dict[str, Any]]:
+    """Return the decoded ``output_json`` object from message content, if present."""
+
+    if not isinstance(message_content, list):
+        return None
+
+    for part in message_content:
+        if isinstance(part, dict) and part.get("type") == "output_json":
+            if "json" in part:
+                payload = part["json"]
+                return payload if isinstance(payload, dict) else None
+            if "text" in part:
+                return None
+    return None
+
+
+def coerce_message_content(message_content: Any) -> str:
+    """Normalise OpenAI-style chat message content to a string payload."""
+
+    if isinstance(message_content, list):
+        json_payload: Any = None
+        fragments: list[str] = []
+
+        # json_schema responses return content parts with type metadata
+        for part in message_content:
+            if not isinstance(part, dict):
+                continue
+
+            part_type = part.get("type")
+
+            if part_type == "output_json":
+                if "json" in part:
+                    json_payload = part["json"]
+                    break
+                if "text" in part:
+                    return part["text"]
+
+            text_value = part.get("text")
+            if text_value:
+                fragments.append(text_value)
+
+        if json_payload is not None:
+            if isinstance(json_payload, (dict, list)):
+                try:
+                    return json.dumps(json_payload)
+                except TypeError:
+                    return str(json_payload)
+            return str(json_payload)
+
+        return "".join(fragments)
+
+    if isinstance(message_content, str):
+        return message_content
+
+    return str(message_content)
+
+
+def encode_chat_body(body: Dict[str, Any], response_format_json: Optional[bytes] = None) -> bytes:
+    """Serialise a chat-completions body, splicing in a pre-encoded response_format."""
+
+    encoded = orjson.dumps(body)
+    if response_format_json is None:
+        return encoded
+    return encoded[:-1] + b',"response_format":' + response_format_json + b"}"
+
+
+def order_models(models: List[ModelDescriptor]) -> List[ModelDescriptor]:
+    """Sort models by family and id, the order every provider lists them in."""
+
+    return sorted(models, key=attrgetter("family", "id"))
+
+
+def log_list_models_failure(provider: str, exc: Exception) -> None:
+    """Log a failed model listing, at most once per interval for each provider."""
+
+    now = time.monotonic()
+    last = _last_list_models_warning.get(provider)
+    if last is not None and now - last < _LIST_MODELS_WARN_INTERVAL:
+        return
+    _last_list_models_warning[provider] = now
+    logger.warning("list_models_failed", provider=provider, error=str(exc))
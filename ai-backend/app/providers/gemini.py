@@ -6,7 +6,16 @@ from typing import Any, Dict, List
 
 import httpx
 
-from .base import LLMProvider, LLMRawResponse, ModelDescriptor, PromptPacket, ProviderCapabilities
+from .base import (
+    FallbackModelList,
+    LLMProvider,
+    LLMRawResponse,
+    ModelDescriptor,
+    PromptPacket,
+    ProviderCapabilities,
+    log_list_models_failure,
+    order_models,
+)
 
 
 class GeminiProvider(LLMProvider):
@@ -41,6 +50,7 @@ class GeminiProvider(LLMProvider):
                         notes=item.get("description"),
                     )
                 )
-            return models
-        except Exception:
-            return []
+            return order_models(models)
+        except (httpx.HTTPError, ValueError, KeyError) as exc:
+            log_list_models_failure("gemini", exc)
+            return FallbackModelList()
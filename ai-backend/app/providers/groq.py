@@ -1,13 +1,42 @@
 """Groq provider implementation"""
-import json
 import httpx
 from typing import Any, Dict, List
 from .base import (
+    FallbackModelList,
     LLMProvider,
     PromptPacket,
     LLMRawResponse,
     ProviderCapabilities,
-    ModelDescriptor
+    ModelDescriptor,
+    coerce_message_content,
+    encode_chat_body,
+    log_list_models_failure,
+    message_json_payload,
+    order_models,
+)
+
+_GROQ_FALLBACK: tuple[ModelDescriptor, ...] = (
+    ModelDescriptor(
+        id="llama-3.1-70b-versatile",
+        family="llama",
+        context_window=128000,
+        supports_json_schema=False,
+        notes="Fast inference, versatile"
+    ),
+    ModelDescriptor(
+        id="llama-3.1-8b-instant",
+        family="llama",
+        context_window=128000,
+        supports_json_schema=False,
+        notes="Ultra-fast, smaller model"
+    ),
+    ModelDescriptor(
+        id="mixtral-8x7b-32768",
+        family="mixtral",
+        context_window=32768,
+        supports_json_schema=False,
+        notes="Mixture of experts"
+    ),
 )
 
 
@@ -39,7 +68,7 @@ class GroqProvider(LLMProvider):
             "temperature": prompt.temperature
         }
 
-        if prompt.response_format:
+        if prompt.response_format and prompt.response_format_json is None:
             body["response_format"] = prompt.response_format
 
         if prompt.tools:
@@ -51,7 +80,7 @@ class GroqProvider(LLMProvider):
         response = await self.http_client.post(
             self.BASE_URL,
             headers=headers,
-            json=body,
+            content=encode_chat_body(body, prompt.response_format_json),
             timeout=60.0
         )
         response.raise_for_status()
@@ -59,56 +88,19 @@ class GroqProvider(LLMProvider):
         data = response.json()
         choice = data["choices"][0]
         message_content = choice["message"].get("content", "")
-        content_text = self._coerce_message_content(message_content)
+        # Keep output_json objects as-is rather than re-serialising them for the caller
+        parsed = message_json_payload(message_content)
+        content_text = "" if parsed is not None else coerce_message_content(message_content)
 
         return LLMRawResponse(
             content=content_text,
+            parsed=parsed,
             model=data.get("model", prompt.model),
             provider="groq",
             finish_reason=choice.get("finish_reason"),
             usage=data.get("usage")
         )
 
-    @staticmethod
-    def _coerce_message_content(message_content: Any) -> str:
-        """Groq mirrors OpenAI responses; normalise to text."""
-
-        if isinstance(message_content, list):
-            json_payload: Any = None
-            fragments: list[str] = []
-
-            for part in message_content:
-                if not isinstance(part, dict):
-                    continue
-
-                part_type = part.get("type")
-
-                if part_type == "output_json":
-                    if "json" in part:
-                        json_payload = part["json"]
-                        break
-                    if "text" in part:
-                        return part["text"]
-
-                text_value = part.get("text")
-                if text_value:
-                    fragments.append(text_value)
-
-            if json_payload is not None:
-                if isinstance(json_payload, (dict, list)):
-                    try:
-                        return json.dumps(json_payload)
-                    except TypeError:
-                        return str(json_payload)
-                return str(json_payload)
-
-            return "".join(fragments)
-
-        if isinstance(message_content, str):
-            return message_content
-
-        return str(message_content)
-
     def capabilities(self) -> ProviderCapabilities:
         """Groq supports plain JSON mode"""
         return ProviderCapabilities(
@@ -164,32 +156,9 @@ class GroqProvider(LLMProvider):
                 ))
 
             # Sort by family and ID for consistent ordering
-            models.sort(key=lambda m: (m.family, m.id))
+            return order_models(models)
 
-            return models
-
-        except Exception as e:
-            # Fallback to hardcoded list if API call fails
-            return [
-                ModelDescriptor(
-                    id="llama-3.1-70b-versatile",
-                    family="llama",
-                    context_window=128000,
-                    supports_json_schema=False,
-                    notes="Fast inference, versatile"
-                ),
-                ModelDescriptor(
-                    id="llama-3.1-8b-instant",
-                    family="llama",
-                    context_window=128000,
-                    supports_json_schema=False,
-                    notes="Ultra-fast, smaller model"
-                ),
-                ModelDescriptor(
-                    id="mixtral-8x7b-32768",
-                    family="mixtral",
-                    context_window=32768,
-                    supports_json_schema=False,
-                    notes="Mixture of experts"
-                )
-            ]
+        except (httpx.HTTPError, ValueError, KeyError) as exc:
+            # Fall back to the static catalogue if the API call fails
+            log_list_models_failure("groq", exc)
+            return FallbackModelList(order_models(list(_GROQ_FALLBACK)))
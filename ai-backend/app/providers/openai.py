@@ -1,13 +1,42 @@
 """OpenAI provider implementation"""
-import json
 import httpx
 from typing import Any, Dict, List
 from .base import (
+    FallbackModelList,
     LLMProvider,
     PromptPacket,
     LLMRawResponse,
     ProviderCapabilities,
-    ModelDescriptor
+    ModelDescriptor,
+    coerce_message_content,
+    encode_chat_body,
+    log_list_models_failure,
+    message_json_payload,
+    order_models,
+)
+
+_OPENAI_FALLBACK: tuple[ModelDescriptor, ...] = (
+    ModelDescriptor(
+        id="gpt-4o",
+        family="gpt-4",
+        context_window=128000,
+        supports_json_schema=True,
+        notes="Most capable model"
+    ),
+    ModelDescriptor(
+        id="gpt-4o-mini",
+        family="gpt-4",
+        context_window=128000,
+        supports_json_schema=True,
+        notes="Fast and cost-effective"
+    ),
+    ModelDescriptor(
+        id="gpt-4-turbo",
+        family="gpt-4",
+        context_window=128000,
+        supports_json_schema=True,
+        notes="Previous generation"
+    ),
 )
 
 
@@ -39,7 +68,7 @@ class OpenAIProvider(LLMProvider):
             "temperature": prompt.temperature
         }
 
-        if prompt.response_format:
+        if prompt.response_format and prompt.response_format_json is None:
             body["response_format"] = prompt.response_format
 
         if prompt.tools:
@@ -51,7 +80,7 @@ class OpenAIProvider(LLMProvider):
         response = await self.http_client.post(
             self.BASE_URL,
             headers=headers,
-            json=body,
+            content=encode_chat_body(body, prompt.response_format_json),
             timeout=60.0
         )
         response.raise_for_status()
@@ -59,57 +88,19 @@ class OpenAIProvider(LLMProvider):
         data = response.json()
         choice = data["choices"][0]
         message_content = choice["message"].get("content", "")
-        content_text = self._coerce_message_content(message_content)
+        # Keep output_json objects as-is rather than re-serialising them for the caller
+        parsed = message_json_payload(message_content)
+        content_text = "" if parsed is not None else coerce_message_content(message_content)
 
         return LLMRawResponse(
             content=content_text,
+            parsed=parsed,
             model=data.get("model", prompt.model),
             provider="openai",
             finish_reason=choice.get("finish_reason"),
             usage=data.get("usage")
         )
 
-    @staticmethod
-    def _coerce_message_content(message_content: Any) -> str:
-        """Normalise OpenAI message content to a string payload."""
-
-        if isinstance(message_content, list):
-            json_payload: Any = None
-            fragments: list[str] = []
-
-            # OpenAI json_schema responses return content parts with type metadata
-            for part in message_content:
-                if not isinstance(part, dict):
-                    continue
-
-                part_type = part.get("type")
-
-                if part_type == "output_json":
-                    if "json" in part:
-                        json_payload = part["json"]
-                        break
-                    if "text" in part:
-                        return part["text"]
-
-                text_value = part.get("text")
-                if text_value:
-                    fragments.append(text_value)
-
-            if json_payload is not None:
-                if isinstance(json_payload, (dict, list)):
-                    try:
-                        return json.dumps(json_payload)
-                    except TypeError:
-                        return str(json_payload)
-                return str(json_payload)
-
-            return "".join(fragments)
-
-        if isinstance(message_content, str):
-            return message_content
-
-        return str(message_content)
-    
     def capabilities(self) -> ProviderCapabilities:
         """OpenAI supports JSON schema enforcement"""
         return ProviderCapabilities(
@@ -159,33 +150,9 @@ class OpenAIProvider(LLMProvider):
                     ))
 
             # Sort by family and ID for consistent ordering
-            models.sort(key=lambda m: (m.family, m.id))
-
-            return models
-
-        except Exception as e:
-            # Fallback to hardcoded list if API call fails
-            return [
-                ModelDescriptor(
-                    id="gpt-4o",
-                    family="gpt-4",
-                    context_window=128000,
-                    supports_json_schema=True,
-                    notes="Most capable model"
-                ),
-                ModelDescriptor(
-                    id="gpt-4o-mini",
-                    family="gpt-4",
-                    context_window=128000,
-                    supports_json_schema=True,
-                    notes="Fast and cost-effective"
-                ),
-                ModelDescriptor(
-                    id="gpt-4-turbo",
-                    family="gpt-4",
-                    context_window=128000,
-                    supports_json_schema=True,
-                    notes="Previous generation"
-                )
-            ]
+            return order_models(models)
 
+        except (httpx.HTTPError, ValueError, KeyError) as exc:
+            # Fall back to the static catalogue if the API call fails
+            log_list_models_failure("openai", exc)
+            return FallbackModelList(order_models(list(_OPENAI_FALLBACK)))
@@ -1,13 +1,48 @@
 """OpenRouter provider implementation"""
-import json
 import httpx
 from typing import Any, Dict, List
 from .base import (
+    FallbackModelList,
     LLMProvider,
     PromptPacket,
     LLMRawResponse,
     ProviderCapabilities,
-    ModelDescriptor
+    ModelDescriptor,
+    coerce_message_content,
+    encode_chat_body,
+    log_list_models_failure,
+    message_json_payload,
+    order_models,
+)
+
+_OPENROUTER_FALLBACK: tuple[ModelDescriptor, ...] = (
+    ModelDescriptor(
+        id="openrouter/auto",
+        family="auto",
+        supports_json_schema=False,
+        notes="Automatic model selection"
+    ),
+    ModelDescriptor(
+        id="anthropic/claude-3.5-sonnet",
+        family="claude",
+        context_window=200000,
+        supports_json_schema=False,
+        notes="Most capable Claude model"
+    ),
+    ModelDescriptor(
+        id="google/gemini-pro-1.5",
+        family="gemini",
+        context_window=1000000,
+        supports_json_schema=False,
+        notes="Large context window"
+    ),
+    ModelDescriptor(
+        id="meta-llama/llama-3.1-70b-instruct",
+        family="llama",
+        context_window=128000,
+        supports_json_schema=False,
+        notes="Open source model"
+    ),
 )
 
 
@@ -31,7 +66,7 @@ class OpenRouterProvider(LLMProvider):
         }
 
         messages = [
-            {"role": "system", "content": prompt.system_prompt},
+            {"role": "system", "content": prompt.system_blocks or prompt.system_prompt},
             {"role": "user", "content": prompt.user_prompt}
         ]
 
@@ -41,7 +76,7 @@ class OpenRouterProvider(LLMProvider):
             "temperature": prompt.temperature
         }
 
-        if prompt.response_format:
+        if prompt.response_format and prompt.response_format_json is None:
             body["response_format"] = prompt.response_format
 
         if prompt.tools:
@@ -53,7 +88,7 @@ class OpenRouterProvider(LLMProvider):
         response = await self.http_client.post(
             self.BASE_URL,
             headers=headers,
-            json=body,
+            content=encode_chat_body(body, prompt.response_format_json),
             timeout=60.0
         )
         response.raise_for_status()
@@ -61,62 +96,26 @@ class OpenRouterProvider(LLMProvider):
         data = response.json()
         choice = data["choices"][0]
         message_content = choice["message"].get("content", "")
-        content_text = self._coerce_message_content(message_content)
+        # Keep output_json objects as-is rather than re-serialising them for the caller
+        parsed = message_json_payload(message_content)
+        content_text = "" if parsed is not None else coerce_message_content(message_content)
 
         return LLMRawResponse(
             content=content_text,
+            parsed=parsed,
             model=data.get("model", prompt.model),
             provider="openrouter",
             finish_reason=choice.get("finish_reason"),
             usage=data.get("usage")
         )
 
-    @staticmethod
-    def _coerce_message_content(message_content: Any) -> str:
-        """OpenRouter mirrors OpenAI responses; normalise to text."""
-
-        if isinstance(message_content, list):
-            json_payload: Any = None
-            fragments: list[str] = []
-
-            for part in message_content:
-                if not isinstance(part, dict):
-                    continue
-
-                part_type = part.get("type")
-
-                if part_type == "output_json":
-                    if "json" in part:
-                        json_payload = part["json"]
-                        break
-                    if "text" in part:
-                        return part["text"]
-
-                text_value = part.get("text")
-                if text_value:
-                    fragments.append(text_value)
-
-            if json_payload is not None:
-                if isinstance(json_payload, (dict, list)):
-                    try:
-                        return json.dumps(json_payload)
-                    except TypeError:
-                        return str(json_payload)
-                return str(json_payload)
-
-            return "".join(fragments)
-
-        if isinstance(message_content, str):
-            return message_content
-
-        return str(message_content)
-
     def capabilities(self) -> ProviderCapabilities:
-        """OpenRouter supports plain JSON mode"""
+        """OpenRouter supports plain JSON mode and cache_control content blocks"""
         return ProviderCapabilities(
             supports_json_schema=False,
             supports_function_call=False,
-            supports_plain_json=True
+            supports_plain_json=True,
+            supports_prompt_cache=True
         )
 
     async def list_models(self) -> List[ModelDescriptor]:
@@ -161,38 +160,9 @@ class OpenRouterProvider(LLMProvider):
                 ))
 
             # Sort by family and ID for consistent ordering
-            models.sort(key=lambda m: (m.family, m.id))
-
-            return models
+            return order_models(models)
 
-        except Exception as e:
-            # Fallback to hardcoded list if API call fails
-            return [
-                ModelDescriptor(
-                    id="openrouter/auto",
-                    family="auto",
-                    supports_json_schema=False,
-                    notes="Automatic model selection"
-                ),
-                ModelDescriptor(
-                    id="anthropic/claude-3.5-sonnet",
-                    family="claude",
-                    context_window=200000,
-                    supports_json_schema=False,
-                    notes="Most capable Claude model"
-                ),
-                ModelDescriptor(
-                    id="google/gemini-pro-1.5",
-                    family="gemini",
-                    context_window=1000000,
-                    supports_json_schema=False,
-                    notes="Large context window"
-                ),
-                ModelDescriptor(
-                    id="meta-llama/llama-3.1-70b-instruct",
-                    family="llama",
-                    context_window=128000,
-                    supports_json_schema=False,
-                    notes="Open source model"
-                )
-            ]
+        except (httpx.HTTPError, ValueError, KeyError) as exc:
+            # Fall back to the static catalogue if the API call fails
+            log_list_models_failure("openrouter", exc)
+            return FallbackModelList(order_models(list(_OPENROUTER_FALLBACK)))
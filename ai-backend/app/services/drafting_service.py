@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from ..models.document_models import DocumentBundle, DocDraft, Item, Party, Terms, Totals, Dates
 from ..providers.base import LLMProvider, PromptPacket
@@ -19,6 +25,65 @@ SYSTEM_PROMPT = (
     "Use conservative defaults when ambiguous."
 )
 
+# Static instructions lead so the prompt shares a cacheable prefix across requests
+_USER_PROMPT_TMPL = (
+    "Return exactly one JSON object of type DocumentBundle.\n"
+    "Schema name: DocumentBundle\n\n"
+    "Requirement:\n{requirement}\n\n"
+    "Preferences:\n"
+    "- doc_types: {doc_types}\n"
+    "- currency: {currency}\n"
+    "- seller_defaults: {seller_defaults}\n"
+    "- buyer_hint: {buyer_hint}"
+)
+
+# Static system prompt marked cacheable for providers that honour cache_control
+SYSTEM_BLOCKS = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+PLAIN_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Maximum number of generated bundles remembered for identical requests
+RESPONSE_CACHE_SIZE = 256
+
+# Doc type served by the bundle's project_brief section rather than a draft
+PROJECT_BRIEF_DOC_TYPE = "PROJECT_BRIEF"
+
+
+def _referenced_defs(node: Any, defs: Dict[str, Any], found: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the ``$defs`` entries reachable from ``node`` through local ``$ref`` pointers."""
+
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            name = ref[len("#/$defs/"):]
+            if name not in found and name in defs:
+                found[name] = defs[name]
+                _referenced_defs(defs[name], defs, found)
+        for value in node.values():
+            _referenced_defs(value, defs, found)
+    elif isinstance(node, list):
+        for value in node:
+            _referenced_defs(value, defs, found)
+    return found
+
+
+def _section_schema(schema: Dict[str, Any], doc_type: str) -> Dict[str, Any]:
+    """Narrow the DocumentBundle schema to the part that produces a single ``doc_type``."""
+
+    defs = schema.get("$defs", {})
+    if doc_type == PROJECT_BRIEF_DOC_TYPE:
+        properties = {"project_brief": {"$ref": "#/$defs/ProjectBrief"}}
+        required = ["project_brief"]
+    else:
+        properties = {"drafts": {"type": "array", "minItems": 1, "maxItems": 1, "items": {"$ref": "#/$defs/DocDraft"}}}
+        required = ["drafts"]
+    section = {"title": schema.get("title", "DocumentBundle"), "type": "object", "required": required, "properties": properties}
+    section_defs = deepcopy(_referenced_defs(properties, defs, {}))
+    if "DocDraft" in section_defs:
+        section_defs["DocDraft"]["properties"]["doc_type"] = {"type": "string", "enum": [doc_type]}
+    section["$defs"] = section_defs
+    return section
+
 
 class DraftingService:
     """Coordinates prompt construction, provider invocation, and validation."""
@@ -26,6 +91,52 @@ class DraftingService:
     def __init__(self, validation: ValidationService) -> None:
         self.validation = validation
         self.schema = validation.schema
+        # The schema is static per process, so build and encode the json_schema response_format once
+        self._rf_schema = {
+            "type": "json_schema",
+            "json_schema": {"name": "DocumentBundle", "schema": self.schema},
+        }
+        self._schema_bytes = orjson.dumps(self.schema)
+        self._rf_schema_bytes = (
+            b'{"type":"json_schema","json_schema":{"name":"DocumentBundle","schema":'
+            + self._schema_bytes
+            + b"}}"
+        )
+        self._response_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        # One narrowed schema per known doc type for generate_bundle_parallel; unknown types use the full one
+        doc_type_enum = self.schema.get("$defs", {}).get("DocDraft", {}).get("properties", {}).get("doc_type", {})
+        self._rf_sections: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+        for doc_type in [*doc_type_enum.get("enum", []), PROJECT_BRIEF_DOC_TYPE]:
+            section = _section_schema(self.schema, doc_type)
+            rf_section = {"type": "json_schema", "json_schema": {"name": "DocumentBundle", "schema": section}}
+            self._rf_sections[doc_type] = (rf_section, orjson.dumps(rf_section))
+
+    @staticmethod
+    def _cache_key(
+        provider: LLMProvider,
+        model: str,
+        requirement: str,
+        doc_types: Optional[List[str]],
+        currency: str,
+        seller_defaults: Optional[Dict[str, str]],
+        buyer_hint: Optional[str],
+    ) -> bytes:
+        material = [
+            type(provider).__name__,
+            model,
+            requirement,
+            sorted(doc_types or ["QUOTATION"]),
+            currency,
+            seller_defaults,
+            buyer_hint,
+        ]
+        return hashlib.blake2b(orjson.dumps(material, option=orjson.OPT_SORT_KEYS)).digest()
+
+    def _remember(self, key: bytes, bundle: Dict[str, Any]) -> None:
+        self._response_cache[key] = deepcopy(bundle)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
 
     def _build_user_prompt(
         self,
@@ -35,16 +146,14 @@ class DraftingService:
         defaults: Optional[Dict[str, str]] = None,
         buyer_hint: Optional[str] = None,
     ) -> str:
-        doc_types = doc_types or ["QUOTATION"]
-        return (
-            f"Requirement:\n{requirement}\n\n"
-            f"Preferences:\n"
-            f"- doc_types: {doc_types}\n"
-            f"- currency: {currency}\n"
-            f"- seller_defaults: {defaults or None}\n"
-            f"- buyer_hint: {buyer_hint or None}\n\n"
-            "Return exactly one JSON object of type DocumentBundle.\n"
-            "Schema name: DocumentBundle"
+        return _USER_PROMPT_TMPL.format_map(
+            {
+                "requirement": requirement,
+                "doc_types": orjson.dumps(doc_types or ["QUOTATION"]).decode(),
+                "currency": currency,
+                "seller_defaults": orjson.dumps(defaults or None).decode(),
+                "buyer_hint": buyer_hint or None,
+            }
         )
 
     async def generate_bundle(
@@ -57,11 +166,22 @@ class DraftingService:
         seller_defaults: Optional[Dict[str, str]] = None,
         buyer_hint: Optional[str] = None,
     ) -> Dict[str, any]:
-        """Generate a bundle using provider if available, else fallback blueprint."""
+        """Generate a bundle using provider if available, else fallback blueprint.
+
+        Successful provider results are kept in a small LRU keyed on the request inputs.
+        """
 
         if provider is None:
             return self._fallback_bundle(requirement, doc_types, currency, seller_defaults)
 
+        cache_key = self._cache_key(
+            provider, model, requirement, doc_types, currency, seller_defaults, buyer_hint
+        )
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return deepcopy(cached)
+
         user_prompt = self._build_user_prompt(
             requirement=requirement,
             doc_types=doc_types,
@@ -69,35 +189,132 @@ class DraftingService:
             defaults=seller_defaults,
             buyer_hint=buyer_hint,
         )
+        packet = self._build_packet(provider, model, user_prompt, self._rf_schema, self._rf_schema_bytes)
 
+        cacheable = True
+        payload = await self._generate_section(provider, packet)
+        if payload is None:
+            # Provider failures are not cached so the next attempt retries the call
+            cacheable = False
+            payload = self._fallback_bundle(requirement, doc_types, currency, seller_defaults)
+
+        payload = await self._validated(payload)
+        if cacheable:
+            self._remember(cache_key, payload)
+        return payload
+
+    async def generate_bundle_parallel(
+        self,
+        provider: Optional[LLMProvider],
+        model: str,
+        requirement: str,
+        doc_types: Optional[List[str]] = None,
+        currency: str = "INR",
+        seller_defaults: Optional[Dict[str, str]] = None,
+        buyer_hint: Optional[str] = None,
+    ) -> Dict[str, any]:
+        """Generate each requested doc type concurrently and merge them into one bundle.
+
+        Every call asks only for its own doc type under a narrowed schema, and the merged
+        bundle goes through the same validation and repair as ``generate_bundle``. A single
+        doc type, or no provider, falls through to ``generate_bundle``.
+        """
+
+        doc_types = list(dict.fromkeys(doc_types or ["QUOTATION"]))
+        if provider is None or len(doc_types) < 2:
+            return await self.generate_bundle(
+                provider, model, requirement, doc_types, currency, seller_defaults, buyer_hint
+            )
+
+        cache_key = self._cache_key(
+            provider, model, requirement, doc_types, currency, seller_defaults, buyer_hint
+        )
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return deepcopy(cached)
+
+        packets = []
+        for doc_type in doc_types:
+            rf, rf_bytes = self._rf_sections.get(doc_type, (self._rf_schema, self._rf_schema_bytes))
+            user_prompt = self._build_user_prompt(
+                requirement=requirement,
+                doc_types=[doc_type],
+                currency=currency,
+                defaults=seller_defaults,
+                buyer_hint=buyer_hint,
+            )
+            packets.append(self._build_packet(provider, model, user_prompt, rf, rf_bytes))
+
+        sections = await asyncio.gather(*(self._generate_section(provider, packet) for packet in packets))
+
+        cacheable = True
+        drafts: List[Any] = []
+        project_brief = None
+        for doc_type, section in zip(doc_types, sections):
+            if section is None:
+                cacheable = False
+                if doc_type != PROJECT_BRIEF_DOC_TYPE:
+                    drafts.extend(self._fallback_bundle(requirement, [doc_type], currency, seller_defaults)["drafts"])
+                continue
+            section_drafts = section.get("drafts")
+            if isinstance(section_drafts, list):
+                drafts.extend(section_drafts)
+            if project_brief is None and section.get("project_brief"):
+                project_brief = section["project_brief"]
+
+        payload: Dict[str, Any] = {"drafts": drafts}
+        if project_brief is not None:
+            payload["project_brief"] = project_brief
+
+        payload = await self._validated(payload)
+        if cacheable:
+            self._remember(cache_key, payload)
+        return payload
+
+    def _build_packet(
+        self,
+        provider: LLMProvider,
+        model: str,
+        user_prompt: str,
+        rf_schema: Dict[str, Any],
+        rf_schema_bytes: bytes,
+    ) -> PromptPacket:
         response_format = None
+        response_format_json = None
         capabilities = provider.capabilities()
         if capabilities.supports_json_schema:
-            response_format = {
-                "type": "json_schema",
-                "json_schema": {"name": "DocumentBundle", "schema": self.schema},
-            }
+            response_format = rf_schema
+            response_format_json = rf_schema_bytes
         elif capabilities.supports_plain_json:
-            response_format = {"type": "json_object"}
+            response_format = PLAIN_JSON_RESPONSE_FORMAT
 
-        packet = PromptPacket(
+        return PromptPacket(
             system_prompt=SYSTEM_PROMPT,
+            system_blocks=SYSTEM_BLOCKS if capabilities.supports_prompt_cache else None,
             user_prompt=user_prompt,
             model=model,
             temperature=0.2,
             response_format=response_format,
+            response_format_json=response_format_json,
         )
 
+    async def _generate_section(self, provider: LLMProvider, packet: PromptPacket) -> Optional[Dict[str, Any]]:
+        """Run one provider call under its concurrency limit; returns None when it fails."""
+
         try:
-            result = await provider.generate(packet)
-            payload = self.validation.extract_json(result.content)
+            result = await provider.generate_bounded(packet)
+            if result.parsed is not None:
+                return result.parsed
+            return self.validation.extract_json(result.content)
         except Exception:
-            payload = self._fallback_bundle(requirement, doc_types, currency, seller_defaults)
+            return None
 
-        is_valid, errors = self.validation.validate(payload)
+    async def _validated(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # Validation and repair are CPU-bound; keep them off the event loop
+        is_valid, errors = await asyncio.to_thread(self.validation.validate, payload)
         if not is_valid:
-            payload = repair_bundle(payload)
-
+            payload = await asyncio.to_thread(repair_bundle, payload)
         return payload
 
     def _fallback_bundle(
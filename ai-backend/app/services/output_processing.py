@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from datetime import date, timedelta
-from typing import Any, Dict, Iterable, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
 
 from pydantic import ValidationError
 
-from ..models.generation import GenerationRequest, HintItem
+try:  # NumPy is optional; only used to sum long item lists
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..models.generation import GenerationRequest, HintDates, HintDocMeta, HintItem, HintPayment
 from ..models.inputs import Address
 from ..models.outputs import (
     Item,
@@ -23,10 +28,21 @@ from ..models.outputs import (
 from ..services.totals import number_to_words_indian
 from ..services.upi import generate_upi_deeplink
 
-_DEFAULT_TERMS = [
+# Below this many items the scalar loop beats NumPy's array setup cost
+_VECTORISE_MIN_ITEMS = 8
+
+# Party fields copied from the model output, falling back to the same attribute on the request
+_PARTY_FIELDS = ("name", "email", "phone", "gstin", "pan")
+
+_DEFAULT_TERMS = (
     "Prices exclusive of applicable taxes unless stated otherwise",
     "Payment terms as per agreement",
-]
+)
+
+# (name, start offset days, end offset days) materialised against the build date
+_DEFAULT_MILESTONES = (("Discovery", 0, 7), ("Execution", 8, 30))
+
+_DEFAULT_BILLING_PLAN = (("Project kickoff", 40), ("Midway", 40), ("Completion", 20))
 
 
 def _to_float(value: Any, default: float = 0.0) -> float:
@@ -47,6 +63,19 @@ def _to_int(value: Any, default: int = 0) -> int:
         return default
 
 
+def _coerce_date(value: Any, default: Optional[date] = None) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return default
+
+
 def _format_address(address: Optional[Address]) -> Optional[str]:
     if address is None:
         return None
@@ -64,15 +93,13 @@ def _format_address(address: Optional[Address]) -> Optional[str]:
 
 def _ensure_party(raw: Any, fallback) -> Dict[str, Any]:
     payload = raw if isinstance(raw, dict) else {}
-    address_source = getattr(fallback, "billing_address", None) or getattr(fallback, "shipping_address", None)
-    return {
-        "name": payload.get("name") or fallback.name,
-        "address": payload.get("address") or _format_address(address_source),
-        "email": payload.get("email") or getattr(fallback, "email", None),
-        "phone": payload.get("phone") or getattr(fallback, "phone", None),
-        "gstin": payload.get("gstin") or getattr(fallback, "gstin", None),
-        "pan": payload.get("pan") or getattr(fallback, "pan", None),
-    }
+    party = {field: payload.get(field) or getattr(fallback, field, None) for field in _PARTY_FIELDS}
+    address = payload.get("address")
+    if not address:
+        address_source = getattr(fallback, "billing_address", None) or getattr(fallback, "shipping_address", None)
+        address = _format_address(address_source)
+    party["address"] = address
+    return party
 
 
 def _ensure_terms(raw: Any, hints) -> Terms:
@@ -113,34 +140,50 @@ def _ensure_items(raw_items: Any, hints: Optional[List[HintItem]], request: Gene
         tax_rate = max(_to_float(entry.get("tax_rate"), 0.0), 0.0)
         unit = entry.get("unit") or "pcs"
         hsn_sac = entry.get("hsn_sac") or None
+        # Every field is already coerced above, so skip pydantic validation
         items.append(
-            Item(
-                description=description,
+            Item.model_construct(
+                description=str(description),
                 qty=qty,
                 unit_price=unit_price,
-                unit=unit,
+                unit=str(unit),
                 discount=discount,
                 tax_rate=tax_rate,
-                hsn_sac=hsn_sac,
+                hsn_sac=str(hsn_sac) if hsn_sac is not None else None,
             )
         )
     return items
 
 
-def _calculate_totals(items: Iterable[Item], shipping: float) -> Totals:
+def _sum_line_amounts(items: Sequence[Item]) -> tuple[float, float, float]:
+    count = len(items)
+    if np is not None and count >= _VECTORISE_MIN_ITEMS:
+        qty = np.fromiter((item.qty for item in items), dtype=np.float64, count=count)
+        unit_price = np.fromiter((item.unit_price for item in items), dtype=np.float64, count=count)
+        discount = np.fromiter((item.discount for item in items), dtype=np.float64, count=count)
+        tax_rate = np.fromiter((item.tax_rate for item in items), dtype=np.float64, count=count)
+        gross = qty * unit_price
+        discount = np.minimum(discount, gross)
+        net = gross - discount
+        return float(gross.sum()), float(discount.sum()), float((net * tax_rate * 0.01).sum())
+
     subtotal = 0.0
     discount_total = 0.0
     tax_total = 0.0
+    # _ensure_items guarantees non-negative floats, so no re-coercion or clamping here
     for item in items:
-        qty = float(item.qty)
-        unit_price = float(item.unit_price)
-        gross = qty * unit_price
-        discount = min(float(item.discount or 0.0), gross)
-        net = max(gross - discount, 0.0)
-        tax_rate = max(float(item.tax_rate or 0.0), 0.0)
+        gross = item.qty * item.unit_price
+        discount = item.discount
+        if discount > gross:
+            discount = gross
         subtotal += gross
         discount_total += discount
-        tax_total += net * (tax_rate / 100.0)
+        tax_total += (gross - discount) * item.tax_rate * 0.01
+    return subtotal, discount_total, tax_total
+
+
+def _calculate_totals(items: Sequence[Item], shipping: float) -> Totals:
+    subtotal, discount_total, tax_total = _sum_line_amounts(items)
     subtotal = round(subtotal, 2)
     discount_total = round(discount_total, 2)
     tax_total = round(tax_total, 2)
@@ -149,7 +192,7 @@ def _calculate_totals(items: Iterable[Item], shipping: float) -> Totals:
     rounded = round(pre_round)
     round_off = round(rounded - pre_round, 2)
     grand_total = round(pre_round + round_off, 2)
-    return Totals(
+    return Totals.model_construct(
         subtotal=subtotal,
         discount_total=discount_total,
         tax_total=tax_total,
@@ -160,51 +203,49 @@ def _calculate_totals(items: Iterable[Item], shipping: float) -> Totals:
     )
 
 
-def _resolve_issue_date(request: GenerationRequest, raw_dates: Any) -> date:
-    if isinstance(raw_dates, dict) and raw_dates.get("issue_date"):
-        try:
-            return date.fromisoformat(str(raw_dates["issue_date"]))
-        except ValueError:
-            pass
-    if request.hints and request.hints.dates and request.hints.dates.issue_date:
-        return request.hints.dates.issue_date
-    return date.today()
+def _resolve_issue_date(hint_dates: Optional[HintDates], raw_dates: Any, today: Optional[date] = None) -> date:
+    if isinstance(raw_dates, dict):
+        resolved = _coerce_date(raw_dates.get("issue_date"))
+        if resolved is not None:
+            return resolved
+    if hint_dates and hint_dates.issue_date:
+        return hint_dates.issue_date
+    return today or date.today()
 
 
-def _resolve_valid_till(issue_date: date, request: GenerationRequest, raw_dates: Any) -> Optional[date]:
-    if isinstance(raw_dates, dict) and raw_dates.get("valid_till"):
-        try:
-            return date.fromisoformat(str(raw_dates["valid_till"]))
-        except ValueError:
-            pass
-    if request.hints and request.hints.dates and request.hints.dates.valid_till:
-        return request.hints.dates.valid_till
+def _resolve_valid_till(issue_date: date, hint_dates: Optional[HintDates], raw_dates: Any) -> Optional[date]:
+    if isinstance(raw_dates, dict):
+        resolved = _coerce_date(raw_dates.get("valid_till"))
+        if resolved is not None:
+            return resolved
+    if hint_dates and hint_dates.valid_till:
+        return hint_dates.valid_till
     return issue_date + timedelta(days=15)
 
 
-def _resolve_due_date(issue_date: date, request: GenerationRequest, raw_dates: Any) -> date:
-    if isinstance(raw_dates, dict) and raw_dates.get("due_date"):
-        try:
-            return date.fromisoformat(str(raw_dates["due_date"]))
-        except ValueError:
-            pass
-    if request.hints and request.hints.dates and request.hints.dates.due_date:
-        return request.hints.dates.due_date
+def _resolve_due_date(issue_date: date, hint_dates: Optional[HintDates], raw_dates: Any) -> date:
+    if isinstance(raw_dates, dict):
+        resolved = _coerce_date(raw_dates.get("due_date"))
+        if resolved is not None:
+            return resolved
+    if hint_dates and hint_dates.due_date:
+        return hint_dates.due_date
     return issue_date + timedelta(days=7)
 
 
-def _ensure_doc_meta(raw: Any, request: GenerationRequest, require_doc_no: bool, prefix: str) -> Dict[str, Any]:
+def _ensure_doc_meta(
+    raw: Any, hint_doc_meta: Optional[HintDocMeta], require_doc_no: bool, prefix: str, today: Optional[date] = None
+) -> Dict[str, Any]:
     data = raw if isinstance(raw, dict) else {}
-    hints = request.hints.doc_meta.model_dump(exclude_none=True) if request.hints and request.hints.doc_meta else {}
+    hints = hint_doc_meta.model_dump(exclude_none=True) if hint_doc_meta else {}
     merged = {**hints, **data}
     if require_doc_no and not merged.get("doc_no"):
-        merged["doc_no"] = f"{prefix}-{date.today():%Y%m%d}"
+        merged["doc_no"] = f"{prefix}-{(today or date.today()):%Y%m%d}"
     return merged
 
 
-def _ensure_payment(raw: Any, request: GenerationRequest) -> Optional[Payment]:
-    data = raw if isinstance(raw, dict) else {}
-    hints = request.hints.payment if request.hints and request.hints.payment else None
+def _ensure_payment(raw: Any, hints: Optional[HintPayment]) -> Optional[Payment]:
+    data = dict(raw) if isinstance(raw, dict) else {}
     if hints:
         if hints.mode:
             data.setdefault("mode", hints.mode)
@@ -237,7 +278,12 @@ def _ensure_gst(raw: Any, request: GenerationRequest) -> Optional[GSTBreakup]:
     return None
 
 
-def _post_payment(payment: Optional[Payment], request: GenerationRequest, totals: Totals) -> Optional[Payment]:
+def _post_payment(
+    payment: Optional[Payment],
+    request: GenerationRequest,
+    totals: Totals,
+    hint_doc_meta: Optional[HintDocMeta] = None,
+) -> Optional[Payment]:
     if payment is None:
         return None
     if payment.mode == "UPI":
@@ -249,24 +295,28 @@ def _post_payment(payment: Optional[Payment], request: GenerationRequest, totals
                 amount=totals.grand_total,
                 currency=request.currency,
                 note=request.requirement[:50],
-                txn_ref=(request.hints.doc_meta.doc_no if request.hints and request.hints.doc_meta else None),
+                txn_ref=hint_doc_meta.doc_no if hint_doc_meta else None,
             )
     return payment
 
 
 def build_quotation_output(raw: Dict[str, Any], request: GenerationRequest) -> QuotationOutput:
-    data = deepcopy(raw) if isinstance(raw, dict) else {}
+    data = dict(raw) if isinstance(raw, dict) else {}
+    today = date.today()
+    hints = request.hints
+    hint_dates = hints.dates if hints else None
+    hint_doc_meta = hints.doc_meta if hints else None
     data.setdefault("doc_type", "QUOTATION")
-    issue_date = _resolve_issue_date(request, data.get("dates"))
-    valid_till = _resolve_valid_till(issue_date, request, data.get("dates"))
-    items = _ensure_items(data.get("items"), request.hints.items if request.hints else None, request)
+    issue_date = _resolve_issue_date(hint_dates, data.get("dates"), today)
+    valid_till = _resolve_valid_till(issue_date, hint_dates, data.get("dates"))
+    items = _ensure_items(data.get("items"), hints.items if hints else None, request)
     shipping = _to_float((data.get("totals") or {}).get("shipping"), 0.0)
     totals = _calculate_totals(items, shipping)
-    terms = _ensure_terms(data.get("terms"), request.hints.terms if request.hints else None)
-    payment = _ensure_payment(data.get("payment"), request)
+    terms = _ensure_terms(data.get("terms"), hints.terms if hints else None)
+    payment = _ensure_payment(data.get("payment"), hints.payment if hints else None)
     party_seller = _ensure_party(data.get("seller"), request.seller)
     party_buyer = _ensure_party(data.get("buyer"), request.buyer)
-    doc_meta = _ensure_doc_meta(data.get("doc_meta"), request, False, "QUO")
+    doc_meta = _ensure_doc_meta(data.get("doc_meta"), hint_doc_meta, False, "QUO", today)
 
     payload = {
         "doc_type": "QUOTATION",
@@ -276,11 +326,12 @@ def build_quotation_output(raw: Dict[str, Any], request: GenerationRequest) -> Q
         "buyer": party_buyer,
         "doc_meta": doc_meta,
         "dates": {"issue_date": issue_date, "valid_till": valid_till},
-        "items": [item.model_dump() for item in items],
-        "totals": totals.model_dump(),
-        "terms": terms.model_dump(),
+        # Typed sub-models are passed through as-is; pydantic does not revalidate instances
+        "items": items,
+        "totals": totals,
+        "terms": terms,
         "notes": data.get("notes") or request.seller.notes,
-        "payment": payment.model_dump(exclude_none=True) if payment else None,
+        "payment": payment,
     }
 
     try:
@@ -289,25 +340,29 @@ def build_quotation_output(raw: Dict[str, Any], request: GenerationRequest) -> Q
         model = QuotationOutput.model_validate(payload, strict=False)
 
     model.totals = totals
-    model.payment = _post_payment(model.payment, request, totals)
+    model.payment = _post_payment(model.payment, request, totals, hint_doc_meta)
     model.dates.valid_till = model.dates.valid_till or valid_till
     return model
 
 
 def build_invoice_output(raw: Dict[str, Any], request: GenerationRequest) -> TaxInvoiceOutput:
-    data = deepcopy(raw) if isinstance(raw, dict) else {}
+    data = dict(raw) if isinstance(raw, dict) else {}
+    today = date.today()
+    hints = request.hints
+    hint_dates = hints.dates if hints else None
+    hint_doc_meta = hints.doc_meta if hints else None
     data.setdefault("doc_type", "TAX_INVOICE")
-    issue_date = _resolve_issue_date(request, data.get("dates"))
-    due_date = _resolve_due_date(issue_date, request, data.get("dates"))
-    items = _ensure_items(data.get("items"), request.hints.items if request.hints else None, request)
+    issue_date = _resolve_issue_date(hint_dates, data.get("dates"), today)
+    due_date = _resolve_due_date(issue_date, hint_dates, data.get("dates"))
+    items = _ensure_items(data.get("items"), hints.items if hints else None, request)
     shipping = _to_float((data.get("totals") or {}).get("shipping"), 0.0)
     totals = _calculate_totals(items, shipping)
-    terms = _ensure_terms(data.get("terms"), request.hints.terms if request.hints else None)
-    payment = _ensure_payment(data.get("payment"), request)
+    terms = _ensure_terms(data.get("terms"), hints.terms if hints else None)
+    payment = _ensure_payment(data.get("payment"), hints.payment if hints else None)
     gst = _ensure_gst(data.get("gst"), request)
     party_seller = _ensure_party(data.get("seller"), request.seller)
     party_buyer = _ensure_party(data.get("buyer"), request.buyer)
-    doc_meta = _ensure_doc_meta(data.get("doc_meta"), request, True, "INV")
+    doc_meta = _ensure_doc_meta(data.get("doc_meta"), hint_doc_meta, True, "INV", today)
 
     payload = {
         "doc_type": "TAX_INVOICE",
@@ -317,11 +372,12 @@ def build_invoice_output(raw: Dict[str, Any], request: GenerationRequest) -> Tax
         "buyer": party_buyer,
         "doc_meta": doc_meta,
         "dates": {"issue_date": issue_date, "due_date": due_date},
-        "items": [item.model_dump() for item in items],
-        "totals": totals.model_dump(),
-        "terms": terms.model_dump(),
-        "payment": payment.model_dump(exclude_none=True) if payment else None,
-        "gst": gst.model_dump(exclude_none=True) if gst else None,
+        # Typed sub-models are passed through as-is; pydantic does not revalidate instances
+        "items": items,
+        "totals": totals,
+        "terms": terms,
+        "payment": payment,
+        "gst": gst,
     }
 
     try:
@@ -330,7 +386,7 @@ def build_invoice_output(raw: Dict[str, Any], request: GenerationRequest) -> Tax
         model = TaxInvoiceOutput.model_validate(payload, strict=False)
 
     model.totals = totals
-    model.payment = _post_payment(model.payment, request, totals)
+    model.payment = _post_payment(model.payment, request, totals, hint_doc_meta)
     model.dates.due_date = model.dates.due_date or due_date
     model.gst = gst
     return model
@@ -341,48 +397,42 @@ def _normalise_billing_plan(raw_parts: Any) -> List[Dict[str, Any]]:
     if isinstance(raw_parts, list):
         parts = [part if isinstance(part, dict) else {} for part in raw_parts]
     if not parts:
-        parts = [{"when": "Project kickoff", "percent": 40}, {"when": "Midway", "percent": 40}, {"when": "Completion", "percent": 20}]
-    total = sum(_to_int(part.get("percent"), 0) for part in parts)
+        parts = [{"when": when, "percent": percent} for when, percent in _DEFAULT_BILLING_PLAN]
+    weights = [max(_to_int(part.get("percent"), 0), 0) for part in parts]
+    total = sum(weights)
+    if total == 100:
+        return parts
     if total == 0:
-        equal = round(100 / len(parts)) if parts else 100
-        parts = [{"when": part.get("when") or f"Milestone {idx+1}", "percent": equal} for idx, part in enumerate(parts)]
-        total = sum(part["percent"] for part in parts)
-    if total != 100 and parts:
-        scaled: List[Dict[str, Any]] = []
-        remainder = 100
-        for idx, part in enumerate(parts):
-            if idx == len(parts) - 1:
-                percent = remainder
-            else:
-                percent = max(round(_to_int(part.get("percent"), 0) * 100 / total), 0)
-                remainder -= percent
-            scaled.append({"when": part.get("when") or f"Milestone {idx+1}", "percent": percent})
-        parts = scaled
-    return parts
-
-
-def _ensure_milestones(raw: Any, request: GenerationRequest) -> List[Dict[str, Any]]:
+        weights = [1] * len(parts)
+        total = len(parts)
+    # Largest-remainder rounding in integer arithmetic so the shares always sum to exactly 100
+    percents = [weight * 100 // total for weight in weights]
+    leftover = 100 - sum(percents)
+    by_remainder = sorted(range(len(parts)), key=lambda idx: -(weights[idx] * 100 % total))
+    for idx in by_remainder[:leftover]:
+        percents[idx] += 1
+    return [
+        {"when": part.get("when") or f"Milestone {idx+1}", "percent": percent}
+        for idx, (part, percent) in enumerate(zip(parts, percents))
+    ]
+
+
+def _ensure_milestones(raw: Any, request: GenerationRequest, today: Optional[date] = None) -> List[Dict[str, Any]]:
+    today = today or date.today()
     milestones: List[Dict[str, Any]] = []
     if isinstance(raw, list):
         milestones = [deepcopy(item) if isinstance(item, dict) else {} for item in raw]
     if not milestones:
-        today = date.today()
         milestones = [
-            {"name": "Discovery", "start": today, "end": today + timedelta(days=7), "fee": 0.0},
-            {"name": "Execution", "start": today + timedelta(days=8), "end": today + timedelta(days=30), "fee": 0.0},
+            {"name": name, "start": today + timedelta(days=start), "end": today + timedelta(days=end), "fee": 0.0}
+            for name, start, end in _DEFAULT_MILESTONES
         ]
     normalised: List[Dict[str, Any]] = []
     for entry in milestones:
         start = entry.get("start")
         end = entry.get("end")
-        try:
-            start_date = start if isinstance(start, date) else date.fromisoformat(str(start))
-        except (TypeError, ValueError):
-            start_date = date.today()
-        try:
-            end_date = end if isinstance(end, date) else date.fromisoformat(str(end))
-        except (TypeError, ValueError):
-            end_date = start_date + timedelta(days=7)
+        start_date = _coerce_date(start, today)
+        end_date = _coerce_date(end) or start_date + timedelta(days=7)
         if end_date < start_date:
             end_date = start_date
         normalised.append(
@@ -408,12 +458,13 @@ def _ensure_scope(raw: Any, fallback: str) -> List[str]:
 
 
 def build_project_brief_output(raw: Dict[str, Any], request: GenerationRequest) -> ProjectBriefOutput:
-    data = deepcopy(raw) if isinstance(raw, dict) else {}
+    data = dict(raw) if isinstance(raw, dict) else {}
+    today = date.today()
     scope = _ensure_scope(data.get("scope"), request.requirement)
     deliverables = _ensure_scope(data.get("deliverables"), request.requirement)
     assumptions = data.get("assumptions") if isinstance(data.get("assumptions"), list) else []
     risks = data.get("risks") if isinstance(data.get("risks"), list) else []
-    milestones = _ensure_milestones(data.get("milestones"), request)
+    milestones = _ensure_milestones(data.get("milestones"), request, today)
     billing_plan = _normalise_billing_plan(data.get("billing_plan"))
     timeline_days = _to_int(data.get("timeline_days"), 30)
     title = data.get("title") or f"{request.seller.name} - Project Brief"
@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import asyncio
+import importlib
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
 from ..core.config import Settings
-from ..providers.base import LLMProvider, ModelDescriptor
-from ..providers.groq import GroqProvider
-from ..providers.openai import OpenAIProvider
-from ..providers.openrouter import OpenRouterProvider
-from ..providers.gemini import GeminiProvider
+from ..core.logging import get_logger
+from ..providers.base import FallbackModelList, LLMProvider
+
+logger = get_logger(__name__)
+
+# (name, provider module, class name, Settings attribute holding its API key), in display order.
+# Provider modules are imported only when their API key is configured.
+_PROVIDER_TABLE = (
+    ("openrouter", "..providers.openrouter", "OpenRouterProvider", "openrouter_api_key"),
+    ("groq", "..providers.groq", "GroqProvider", "groq_api_key"),
+    ("openai", "..providers.openai", "OpenAIProvider", "openai_api_key"),
+    ("gemini", "..providers.gemini", "GeminiProvider", "gemini_key"),
+)
+_PROVIDER_ORDER = tuple(entry[0] for entry in _PROVIDER_TABLE)
+
+
+def _load_provider_class(module_path: str, class_name: str) -> type:
+    module = importlib.import_module(module_path, package=__package__)
+    return getattr(module, class_name)
 
 
 class ProviderSelection:
@@ -28,15 +48,20 @@ class ProviderService:
         self._providers: Dict[str, LLMProvider] = {}
         self._selections: Dict[str, ProviderSelection] = {}
 
-        if settings.openrouter_api_key:
-            self._providers["openrouter"] = OpenRouterProvider(settings.openrouter_api_key, http_client)
-        if settings.groq_api_key:
-            self._providers["groq"] = GroqProvider(settings.groq_api_key, http_client)
-        if settings.openai_api_key:
-            self._providers["openai"] = OpenAIProvider(settings.openai_api_key, http_client)
-        gemini_key = settings.gemini_key
-        if gemini_key:
-            self._providers["gemini"] = GeminiProvider(gemini_key, http_client)
+        for name, module_path, class_name, key_attr in _PROVIDER_TABLE:
+            api_key = getattr(settings, key_attr)
+            if api_key:
+                provider_cls = _load_provider_class(module_path, class_name)
+                self._providers[name] = provider_cls(api_key, http_client)
+
+        # Model catalogues change rarely; keep (fetched_at, dumped models) per provider
+        self._models_cache: Dict[str, Tuple[float, List[Dict[str, object]]]] = {}
+        # One in-flight refresh per provider; concurrent callers await the same future
+        self._inflight: Dict[str, "asyncio.Future[List[Dict[str, object]]]"] = {}
+        self._cache_dir: Optional[Path] = (
+            None if settings.disable_model_cache else Path(settings.models_cache_dir).expanduser()
+        )
+        self._load_disk_cache()
 
     def get_provider(self, name: str) -> Optional[LLMProvider]:
         return self._providers.get(name)
@@ -44,22 +69,109 @@ class ProviderService:
     def is_provider_enabled(self, name: str) -> bool:
         return name in self._providers
 
+    def _load_disk_cache(self) -> None:
+        """Seed the in-memory catalogue cache from files written by a previous process.
+
+        Entries keep their on-disk age, so expired files are still served as a stale
+        fallback when a refresh fails.
+        """
+        if self._cache_dir is None:
+            return
+        now = time.time()
+        for name in self._providers:
+            path = self._cache_dir / f"{name}.json"
+            try:
+                age = max(now - path.stat().st_mtime, 0.0)
+                dumped = orjson.loads(path.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                continue
+            if isinstance(dumped, list):
+                self._models_cache[name] = (time.monotonic() - age, dumped)
+
+    def _write_disk_cache(self, name: str, dumped: List[Dict[str, object]]) -> None:
+        # An empty listing is never persisted over a good catalogue from an earlier run;
+        # fallback catalogues do not reach this point at all
+        if self._cache_dir is None or not dumped:
+            return
+        path = self._cache_dir / f"{name}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(dumped))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("models_cache_write_failed", provider=name, error=str(exc))
+
+    async def _cached_model_dicts(self, name: str) -> List[Dict[str, object]]:
+        ttl = self.settings.models_cache_ttl_seconds
+        cached = self._models_cache.get(name)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        inflight = self._inflight.get(name)
+        if inflight is not None:
+            # shield so a cancelled waiter does not cancel the shared refresh
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[List[Dict[str, object]]]" = asyncio.get_running_loop().create_future()
+        self._inflight[name] = future
+        try:
+            models = await self._providers[name].list_models()
+            if isinstance(models, FallbackModelList):
+                # The live listing failed; the static catalogue is served uncached and
+                # never replaces a real one, even a stale one
+                dumped = cached[1] if cached is not None else [model.model_dump() for model in models]
+                future.set_result(dumped)
+            else:
+                dumped = [model.model_dump() for model in models]
+                self._models_cache[name] = (time.monotonic(), dumped)
+                future.set_result(dumped)
+                await asyncio.to_thread(self._write_disk_cache, name, dumped)
+        except Exception as exc:
+            if future.done():
+                raise
+            if cached is None:
+                future.set_exception(exc)
+                # Mark the exception retrieved in case no other caller was waiting
+                future.exception()
+                raise
+            dumped = cached[1]
+            future.set_result(dumped)
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[name]
+        return dumped
+
+    def invalidate_models_cache(self, name: Optional[str] = None) -> None:
+        """Drop cached model catalogues for one provider, or all when ``name`` is None."""
+        # Only the in-memory copy is dropped; disk files are overwritten on the next refresh
+        if name is None:
+            self._models_cache.clear()
+        else:
+            self._models_cache.pop(name, None)
+
     async def describe_providers(self) -> List[Dict[str, object]]:
+        enabled = [name for name in _PROVIDER_ORDER if name in self._providers]
+        # Query every enabled provider concurrently; a failing catalogue just reports no models
+        results = await asyncio.gather(
+            *(self._cached_model_dicts(name) for name in enabled),
+            return_exceptions=True,
+        )
+        # Shallow copies, so a caller editing the response cannot reach into the shared cache
+        models_by_name: Dict[str, List[Dict[str, object]]] = {
+            name: [] if isinstance(result, BaseException) else list(result)
+            for name, result in zip(enabled, results)
+        }
+
         providers: List[Dict[str, object]] = []
-        for name in ["openrouter", "groq", "openai", "gemini"]:
-            provider = self._providers.get(name)
-            enabled = provider is not None
-            models: List[ModelDescriptor] = []
-            if provider:
-                try:
-                    models = await provider.list_models()
-                except Exception:
-                    models = []
+        for name in _PROVIDER_ORDER:
+            models = models_by_name.get(name, [])
             providers.append(
                 {
                     "name": name,
-                    "enabled": enabled,
-                    "models": [model.model_dump() for model in models],
+                    "enabled": name in self._providers,
+                    "models": models,
                 }
             )
         return providers
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from copy import deepcopy
 from datetime import date, timedelta
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-from ..models.document_models import DocumentBundle, DocDraft, Item
-from .totals import compute_totals
+import orjson
+
+from ..models.document_models import DocumentBundle, DocDraft, Item, ProjectBrief
 
 
 DEFAULT_TERMS = [
@@ -16,6 +18,28 @@ DEFAULT_TERMS = [
 ]
 
 
+def _clone(value: Any) -> Any:
+    """Copy a JSON-like payload via an orjson round trip, falling back to deepcopy."""
+    try:
+        return orjson.loads(orjson.dumps(value))
+    except TypeError:
+        return deepcopy(value)
+
+
+# (key, expected type, default factory) applied to top-level draft fields
+_DRAFT_FIELDS = (
+    ("locale", str, lambda: "en-IN"),
+    ("currency", str, lambda: "INR"),
+    ("seller", dict, lambda: {"name": "Seller"}),
+    ("buyer", dict, lambda: {"name": "Buyer"}),
+)
+
+_TOTAL_FIELDS = ("subtotal", "discount_total", "tax_total", "grand_total", "round_off")
+
+# (key, default) for numeric item fields, matching _coerce_item's fallbacks
+_ITEM_NUMBER_FIELDS = (("qty", 1.0), ("unit_price", 0.0), ("discount", 0.0), ("tax_rate", 0.0))
+
+
 def _ensure_list(value: Any) -> List[Any]:
     if isinstance(value, list):
         return value
@@ -39,6 +63,21 @@ def _coerce_number(value: Any, default: float = 0.0) -> float:
 
 
 def _coerce_item(raw: Dict[str, Any]) -> Dict[str, Any]:
+    description = raw.get("description")
+    numbers = [raw.get(key, default) for key, default in _ITEM_NUMBER_FIELDS]
+    if description and isinstance(description, str) and all(type(value) in (int, float) for value in numbers):
+        # Already well-typed (e.g. a re-repaired draft); DocDraft validation covers the rest
+        qty, unit_price, discount, tax_rate = numbers
+        return {
+            "description": description,
+            "qty": float(qty),
+            "unit_price": float(unit_price),
+            "unit": raw.get("unit", "pcs"),
+            "discount": float(discount),
+            "tax_rate": float(tax_rate),
+            "hsn_sac": raw.get("hsn_sac"),
+        }
+
     data = {
         "description": raw.get("description") or "Line item",
         "qty": _coerce_number(raw.get("qty"), 1.0),
@@ -51,13 +90,19 @@ def _coerce_item(raw: Dict[str, Any]) -> Dict[str, Any]:
     return Item.model_validate(data).model_dump()
 
 
-def _repair_dates(draft: Dict[str, Any]) -> Dict[str, Any]:
-    dates = draft.setdefault("dates", {})
-    issue_raw = dates.get("issue_date") or date.today().isoformat()
+@lru_cache(maxsize=256)
+def _parse_issue_date(value: str) -> Optional[date]:
+    # Drafts in one bundle usually share an issue date, so repeated parses hit the cache
     try:
-        issue_date = date.fromisoformat(str(issue_raw))
+        return date.fromisoformat(value)
     except ValueError:
-        issue_date = date.today()
+        return None
+
+
+def _repair_dates(draft: Dict[str, Any]) -> Dict[str, Any]:
+    dates = draft.setdefault("dates", {})
+    issue_raw = dates.get("issue_date")
+    issue_date = (_parse_issue_date(str(issue_raw)) if issue_raw else None) or date.today()
     dates["issue_date"] = issue_date.isoformat()
 
     if draft.get("doc_type") == "TAX_INVOICE" and not dates.get("due_date"):
@@ -67,8 +112,8 @@ def _repair_dates(draft: Dict[str, Any]) -> Dict[str, Any]:
     return draft
 
 
-def repair_draft(draft: Dict[str, Any]) -> Dict[str, Any]:
-    draft = deepcopy(draft)
+def repair_draft(draft: Dict[str, Any]) -> DocDraft:
+    draft = _clone(draft)
 
     # Fix invalid doc_type values - map PROJECT_BRIEF to QUOTATION
     doc_type = draft.get("doc_type", "QUOTATION")
@@ -78,10 +123,9 @@ def repair_draft(draft: Dict[str, Any]) -> Dict[str, Any]:
     else:
         draft["doc_type"] = doc_type
 
-    draft.setdefault("locale", "en-IN")
-    draft.setdefault("currency", "INR")
-    draft.setdefault("seller", {"name": draft.get("seller", {}).get("name", "Seller")})
-    draft.setdefault("buyer", {"name": draft.get("buyer", {}).get("name", "Buyer")})
+    for key, expected_type, default_factory in _DRAFT_FIELDS:
+        if not isinstance(draft.get(key), expected_type):
+            draft[key] = default_factory()
 
     # Ensure terms has bullets array
     terms = draft.get("terms", {})
@@ -99,11 +143,8 @@ def repair_draft(draft: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(totals, dict):
         totals = {}
     # Coerce all total fields to numbers
-    totals["subtotal"] = _coerce_number(totals.get("subtotal"), 0.0)
-    totals["discount_total"] = _coerce_number(totals.get("discount_total"), 0.0)
-    totals["tax_total"] = _coerce_number(totals.get("tax_total"), 0.0)
-    totals["grand_total"] = _coerce_number(totals.get("grand_total"), 0.0)
-    totals["round_off"] = _coerce_number(totals.get("round_off"), 0.0)
+    for key in _TOTAL_FIELDS:
+        totals[key] = _coerce_number(totals.get(key), 0.0)
     if "shipping" in totals:
         totals["shipping"] = _coerce_number(totals.get("shipping"), 0.0)
     draft["totals"] = totals
@@ -119,16 +160,13 @@ def repair_draft(draft: Dict[str, Any]) -> Dict[str, Any]:
     ]
     draft["items"] = [_coerce_item(item) for item in raw_items]
 
-    # Now validate after all repairs
-    validated = DocDraft.model_validate(draft)
-    # Recompute totals to ensure accuracy
-    totals = compute_totals(validated)
-    validated.totals = totals
-    return validated.model_dump()
+    # Validation also recomputes totals via DocDraft's after-validator
+    return DocDraft.model_validate(draft)
 
 
 def repair_bundle(bundle: Dict[str, Any]) -> Dict[str, Any]:
-    bundle = deepcopy(bundle or {})
+    # repair_draft clones each draft itself, so the bundle is only read here
+    bundle = bundle or {}
     raw_drafts = bundle.get("drafts")
     if not isinstance(raw_drafts, list) or not raw_drafts:
         raw_drafts = [repair_draft({})]
@@ -136,8 +174,9 @@ def repair_bundle(bundle: Dict[str, Any]) -> Dict[str, Any]:
         raw_drafts = [repair_draft(d) for d in raw_drafts]
 
     project_brief = bundle.get("project_brief")
-    payload = {"drafts": raw_drafts}
-    if project_brief:
-        payload["project_brief"] = project_brief
-    repaired = DocumentBundle.model_validate(payload)
+    # Drafts are already validated with fresh totals, so skip the bundle-level revalidation
+    repaired = DocumentBundle.model_construct(
+        drafts=raw_drafts,
+        project_brief=ProjectBrief.model_validate(project_brief) if project_brief else None,
+    )
     return repaired.model_dump(exclude_none=True)
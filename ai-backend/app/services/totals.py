@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Iterable, TYPE_CHECKING
+from functools import lru_cache
+from typing import Iterable, Sequence, TYPE_CHECKING
+
+try:  # NumPy is optional; only used to batch long item lists
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 if TYPE_CHECKING:  # pragma: no cover - avoid circular imports at runtime
     from ..models.document_models import DocDraft, Item, Totals
 
 
-_INDIAN_SCALE = [
+_INDIAN_SCALE = (
     (10000000, "Crore"),
     (100000, "Lakh"),
     (1000, "Thousand"),
     (100, "Hundred"),
-]
+)
+
+# Below this many items the scalar loop beats NumPy's array setup cost
+_BATCH_MIN_ITEMS = 8
 
-_ONES = [
+_ONES = (
     "", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine",
-]
-_TEENS = [
+)
+_TEENS = (
     "Ten",
     "Eleven",
     "Twelve",
@@ -29,10 +38,10 @@ _TEENS = [
     "Seventeen",
     "Eighteen",
     "Nineteen",
-]
-_TENS = [
+)
+_TENS = (
     "", "", "Twenty", "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety",
-]
+)
 
 
 def _two_digit_words(value: int) -> str:
@@ -40,11 +49,11 @@ def _two_digit_words(value: int) -> str:
         return _ONES[value]
     if value < 20:
         return _TEENS[value - 10]
-    tens = _TENS[value // 10]
-    ones = _ONES[value % 10]
-    return f"{tens} {ones}".strip()
+    ones = value % 10
+    return f"{_TENS[value // 10]} {_ONES[ones]}" if ones else _TENS[value // 10]
 
 
+@lru_cache(maxsize=1024)
 def number_to_words_indian(amount: float) -> str:
     if amount == 0:
         return "Zero Rupees Only"
@@ -89,36 +98,68 @@ def compute_line(item: "Item") -> tuple[float, float]:
     return round(line_total, 2), round(line_tax, 2)
 
 
-def aggregate_totals(items: Iterable["Item"]) -> tuple[float, float, float]:
-    subtotal = 0.0
-    discount_total = 0.0
-    tax_total = 0.0
+def _aggregate_paise_batch(items: Sequence["Item"]) -> tuple[int, int, int]:
+    count = len(items)
+    qty = np.fromiter((item.qty for item in items), dtype=np.float64, count=count)
+    unit_price = np.fromiter((item.unit_price for item in items), dtype=np.float64, count=count)
+    discount = np.fromiter((item.discount for item in items), dtype=np.float64, count=count)
+    tax_rate = np.fromiter((item.tax_rate for item in items), dtype=np.float64, count=count)
+    line_total = np.maximum(qty * unit_price - discount, 0.0)
+    return (
+        int(np.rint(line_total * 100.0).astype(np.int64).sum()),
+        int(np.rint(discount * 100.0).astype(np.int64).sum()),
+        int(np.rint(line_total * tax_rate).astype(np.int64).sum()),
+    )
+
+
+def aggregate_totals_paise(items: Iterable["Item"]) -> tuple[int, int, int]:
+    """Return (subtotal, discount_total, tax_total) in integer paise.
 
+    Each line is rounded to whole paise once and the sums are exact integers, so
+    long item lists do not accumulate float drift.
+    """
+    if np is not None and isinstance(items, Sequence) and len(items) >= _BATCH_MIN_ITEMS:
+        return _aggregate_paise_batch(items)
+
+    subtotal = 0
+    discount_total = 0
+    tax_total = 0
+
+    # Single pass with compute_line inlined; Item fields are already validated floats
     for item in items:
-        line_total, line_tax = compute_line(item)
-        subtotal += line_total
-        discount_total += float(item.discount or 0)
-        tax_total += line_tax
+        discount = item.discount
+        line_total = item.qty * item.unit_price - discount
+        if line_total < 0.0:
+            line_total = 0.0
+        subtotal += round(line_total * 100)
+        discount_total += round(discount * 100)
+        # line_total * tax_rate / 100, expressed in paise
+        tax_total += round(line_total * item.tax_rate)
+
+    return subtotal, discount_total, tax_total
 
-    return round(subtotal, 2), round(discount_total, 2), round(tax_total, 2)
+
+def aggregate_totals(items: Iterable["Item"]) -> tuple[float, float, float]:
+    subtotal, discount_total, tax_total = aggregate_totals_paise(items)
+    return subtotal / 100, discount_total / 100, tax_total / 100
 
 
 def compute_totals(draft: "DocDraft") -> "Totals":
     from ..models.document_models import Totals  # local import to avoid circular dependency
-    subtotal, discount_total, tax_total = aggregate_totals(draft.items)
+    subtotal, discount_total, tax_total = aggregate_totals_paise(draft.items)
     shipping = float(draft.totals.shipping if draft.totals else 0.0)
-    preliminary_total = subtotal - discount_total + tax_total + shipping
-    rounded = round(preliminary_total)
-    round_off = round(rounded - preliminary_total, 2)
-    grand_total = round(preliminary_total + round_off, 2)
+    preliminary = subtotal - discount_total + tax_total + round(shipping * 100)
+    # Round to the nearest rupee; round_off is the exact paise difference
+    rounded = round(preliminary / 100) * 100
+    grand_total = rounded / 100
     amount_words = number_to_words_indian(grand_total)
 
     return Totals(
-        subtotal=subtotal,
-        discount_total=discount_total,
-        tax_total=tax_total,
+        subtotal=subtotal / 100,
+        discount_total=discount_total / 100,
+        tax_total=tax_total / 100,
         shipping=shipping,
-        round_off=round_off,
+        round_off=(rounded - preliminary) / 100,
         grand_total=grand_total,
         amount_in_words=amount_words,
     )
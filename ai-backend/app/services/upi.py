@@ -1,8 +1,30 @@
 """UPI deep link generation service"""
+from functools import lru_cache
 from urllib.parse import quote
 from typing import Optional
 
 
+@lru_cache(maxsize=1024)
+def _build_deeplink(
+    upi_id: str,
+    payee_name: str,
+    amount_str: str,
+    currency: str,
+    note: Optional[str],
+    txn_ref: Optional[str],
+    callback_url: Optional[str]
+) -> str:
+    # Build UPI URL in one expression; optional segments collapse to empty strings
+    return (
+        f"upi://pay?pa={quote(upi_id)}&pn={quote(payee_name)}"
+        f"{f'&am={amount_str}' if amount_str else ''}"
+        f"&cu={currency}"
+        f"{f'&tn={quote(note)}' if note else ''}"
+        f"{f'&tr={quote(txn_ref)}' if txn_ref else ''}"
+        f"{f'&url={quote(callback_url)}' if callback_url else ''}"
+    )
+
+
 def generate_upi_deeplink(
     upi_id: str,
     payee_name: str,
@@ -14,25 +36,9 @@ def generate_upi_deeplink(
 ) -> str:
     """Generate UPI deep link according to UPI specification"""
 
-    # Build UPI URL
-    parts = [f"upi://pay?pa={quote(upi_id)}"]
-    parts.append(f"pn={quote(payee_name)}")
-
-    if amount is not None:
-        parts.append(f"am={amount:.2f}")
-
-    parts.append(f"cu={currency}")
-
-    if note:
-        parts.append(f"tn={quote(note)}")
-
-    if txn_ref:
-        parts.append(f"tr={quote(txn_ref)}")
-
-    if callback_url:
-        parts.append(f"url={quote(callback_url)}")
-
-    return "&".join(parts)
+    # Normalise the amount so reprints of the same invoice hit the memoised link
+    amount_str = f"{amount:.2f}" if amount is not None else ""
+    return _build_deeplink(upi_id, payee_name, amount_str, currency, note, txn_ref, callback_url)
 
 
 def generate_upi_qr_payload(
@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import jsonschema
+import orjson
+
+from ..utils.json_extractor import find_json_object
+
+_JSON_CODE_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+# Compiled validators keyed by a hash of their schema, shared across service instances
+_VALIDATORS: Dict[str, jsonschema.protocols.Validator] = {}
+
+
+def _compiled_validator(schema: Dict[str, Any]) -> jsonschema.protocols.Validator:
+    key = hashlib.blake2b(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft202012Validator)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        _VALIDATORS[key] = validator
+    return validator
 
 
 class ValidationErrorDict(Dict[str, Any]):
@@ -23,32 +44,40 @@ class ValidationService:
         with schema_path.open("r", encoding="utf-8") as handle:
             self.schema = json.load(handle)
 
-        self._resolver = jsonschema.validators.RefResolver.from_schema(self.schema)
-        self._validator = jsonschema.validators.Draft202012Validator(
-            self.schema, resolver=self._resolver
-        )
+        # Local "#/$defs/..." references resolve against each schema, so no RefResolver is needed
+        self._validator = _compiled_validator(self.schema)
+        draft_schema = {"$ref": "#/$defs/DocDraft", "$defs": self.schema.get("$defs", {})}
+        self._draft_validator = _compiled_validator(draft_schema)
 
     def extract_json(self, raw: str) -> Dict[str, Any]:
         """Extract a JSON document from raw model output."""
 
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
             pass
 
-        block = re.search(r"```(?:json)?\s*(\{.*\})\s*```", raw, re.DOTALL)
+        # Only run the fenced-block regex when a fence is actually present
+        block = _JSON_CODE_BLOCK.search(raw) if "```" in raw else None
         if block:
             candidate = block.group(1)
             try:
-                return json.loads(candidate)
-            except json.JSONDecodeError:
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError:
                 pass
 
-        brace_match = re.search(r"\{.*\}", raw, re.DOTALL)
+        candidate = find_json_object(raw)
+        if candidate is not None:
+            try:
+                return orjson.loads(candidate)
+            except orjson.JSONDecodeError:
+                pass
+
+        brace_match = _JSON_OBJECT.search(raw)
         if brace_match:
             try:
-                return json.loads(brace_match.group(0))
-            except json.JSONDecodeError:
+                return orjson.loads(brace_match.group(0))
+            except orjson.JSONDecodeError:
                 pass
 
         raise ValueError("Could not extract JSON from provider response")
@@ -63,10 +92,8 @@ class ValidationService:
         return not errors, errors
 
     def validate_draft(self, draft: Dict[str, Any]) -> Tuple[bool, List[Dict[str, str]]]:
-        draft_schema = {"$ref": "#/$defs/DocDraft", "$defs": self.schema.get("$defs", {})}
-        validator = jsonschema.validators.Draft202012Validator(draft_schema, resolver=self._resolver)
         errors = []
-        for error in validator.iter_errors(draft):
+        for error in self._draft_validator.iter_errors(draft):
             path = "/" + "/".join(str(part) for part in error.absolute_path)
             errors.append({"path": path or "/", "message": error.message})
         return not errors, errors
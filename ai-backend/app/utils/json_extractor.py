@@ -2,36 +2,75 @@
 
 from __future__ import annotations
 
-import json
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+import orjson
 
 _JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
 _OBJECT_MATCH = re.compile(r"\{.*\}", re.DOTALL)
 
 
+def find_json_object(text: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` span in ``text`` using a single linear scan."""
+
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : index + 1]
+    return None
+
+
 def extract_json(text: str) -> Dict[str, object]:
     """Extract a JSON object from an arbitrary text snippet."""
 
+    if isinstance(text, str):
+        text = text.strip()
     try:
-        return json.loads(text)
-    except (TypeError, json.JSONDecodeError):
+        return orjson.loads(text)
+    except (TypeError, orjson.JSONDecodeError):
         pass
 
-    block = _JSON_BLOCK.search(text)
+    # Fenced blocks are tried first so braces in surrounding prose cannot shadow them
+    block = _JSON_BLOCK.search(text) if "```" in text else None
     if block:
-        candidate = block.group(1)
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
+            return orjson.loads(block.group(1))
+        except orjson.JSONDecodeError:
+            pass
+
+    candidate = find_json_object(text)
+    if candidate is not None:
+        try:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
             pass
 
     brace = _OBJECT_MATCH.search(text)
     if brace:
-        snippet = brace.group(0)
         try:
-            return json.loads(snippet)
-        except json.JSONDecodeError:
+            return orjson.loads(brace.group(0))
+        except orjson.JSONDecodeError:
             pass
 
     raise ValueError("Could not extract JSON object from response")
@@ -2,13 +2,76 @@
 
 from __future__ import annotations
 
-import json
+import os
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+
+try:  # prompt_toolkit adds line editing and persistent history when installed
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+except ImportError:  # pragma: no cover - optional dependency
+    PromptSession = None
+
+try:  # HTTP/2 needs the optional h2 package (installed via httpx[http2])
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
+try:  # msgspec's reusable decoder is preferred when installed
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Every JSON parse in the UI goes through one decoder; orjson handles pretty-printing
+if msgspec is not None:
+    _json_loads = msgspec.json.Decoder().decode
+    _JSON_DECODE_ERRORS: Tuple[type, ...] = (orjson.JSONDecodeError, msgspec.DecodeError)
+else:
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+
+_PRETTY_JSON = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_SAMPLES_DIR = Path(__file__).resolve().parent / "samples"
+
+_HISTORY_PATH = Path("~/.brief2bill_history").expanduser()
+
+# Opt-in persistence of LastState between sessions (set B2B_UI_PERSIST_STATE=1)
+_STATE_PATH = Path("~/.brief2bill_ui_state.json").expanduser()
+_STATE_MAX_AGE = 24 * 60 * 60.0
+_PERSISTED_FIELDS = ("bundle", "draft", "headers")
+
+# Seconds a fetched /v1/providers listing is reused by the generation prompts
+_PROVIDERS_CACHE_TTL = 30.0
+
+_MENU_TEXT = """
+=================== Brief2Bill Terminal UI ===================
+ 1) GET  /v1/healthz
+ 2) GET  /v1/providers
+ 3) POST /v1/providers/select
+ 4) GET  /v1/providers/active
+ 5) POST /v1/draft
+ 6) POST /v1/validate
+ 7) POST /v1/repair
+ 8) POST /v1/compute/totals
+ 9) POST /v1/upi/deeplink
+10) POST /v1/generate/quotation
+11) POST /v1/generate/invoice
+12) POST /v1/generate/project-brief
+ p) Toggle pretty-printed responses
+ q) Quit
+==============================================================
+
+"""
 
 
 @dataclass
@@ -18,39 +81,74 @@ class LastState:
     bundle: Optional[Dict[str, Any]] = None
     draft: Optional[Dict[str, Any]] = None
     headers: Dict[str, str] = field(default_factory=dict)
+    # (fetched_at, enabled providers) from the last /v1/providers call
+    providers_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
 
 class TerminalUI:
     """Blocking terminal UI for manually testing the FastAPI backend."""
 
+    # Handler method names for menu options 1..12, in menu order
+    _HANDLERS = (
+        "check_health",
+        "list_providers",
+        "select_provider",
+        "get_active_provider",
+        "create_draft",
+        "validate_bundle",
+        "repair_bundle",
+        "compute_totals",
+        "generate_upi",
+        "generate_quotation",
+        "generate_invoice",
+        "generate_project_brief",
+    )
+
     def __init__(self, base_url: str) -> None:
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.Client(base_url=self.base_url, timeout=30.0)
+        # One long-lived pooled client so every menu action reuses the same connection
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0),
+        )
         self.state = LastState()
-        self.samples_dir = Path(__file__).resolve().parent / "samples"
+        # When off, response bodies are written to stdout exactly as received
+        self.pretty = True
+        # Background worker that fetches /v1/providers while the user answers other prompts
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._providers_prefetch: Optional["Future[Tuple[float, httpx.Response]]"] = None
+        # prompt_toolkit needs a real terminal; piped input keeps using input()
+        self._session = (
+            PromptSession(history=FileHistory(str(_HISTORY_PATH)))
+            if PromptSession is not None and sys.stdin.isatty()
+            else None
+        )
+        self.samples_dir = _SAMPLES_DIR
+        # path -> (mtime, parsed payload) for sample files already read this session
+        self._payload_cache: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
+        self._persist_state = os.environ.get("B2B_UI_PERSIST_STATE") == "1"
+        if self._persist_state:
+            self._load_state()
 
     def run(self) -> None:
         try:
             while True:
                 self._print_menu()
-                choice = input("Select option: ").strip().lower()
+                choice = self._ask("Select option: ").lower()
                 if choice in {"q", "quit", "exit"}:
                     print("Exiting.")
                     return
-                handler = {
-                    "1": self.check_health,
-                    "2": self.list_providers,
-                    "3": self.select_provider,
-                    "4": self.get_active_provider,
-                    "5": self.create_draft,
-                    "6": self.validate_bundle,
-                    "7": self.repair_bundle,
-                    "8": self.compute_totals,
-                    "9": self.generate_upi,
-                    "10": self.generate_quotation,
-                    "11": self.generate_invoice,
-                    "12": self.generate_project_brief,
-                }.get(choice)
+                if choice == "p":
+                    self.pretty = not self.pretty
+                    print(f"Pretty-printing {'on' if self.pretty else 'off'}.\n")
+                    continue
+                try:
+                    index = int(choice) - 1
+                except ValueError:
+                    index = -1
+                handler = getattr(self, self._HANDLERS[index]) if 0 <= index < len(self._HANDLERS) else None
                 if handler is None:
                     print("Unknown option. Try again.\n")
                     continue
@@ -61,72 +159,136 @@ class TerminalUI:
                 except Exception as exc:  # noqa: BLE001 - surface unexpected issues interactively
                     print(f"Error: {exc}")
         finally:
+            if self._persist_state:
+                self._save_state()
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.client.close()
 
+    def _load_state(self) -> None:
+        try:
+            if time.time() - _STATE_PATH.stat().st_mtime > _STATE_MAX_AGE:
+                return
+            saved = _json_loads(_STATE_PATH.read_bytes())
+        except (OSError, *_JSON_DECODE_ERRORS):
+            return
+        if not isinstance(saved, dict):
+            return
+        for name in _PERSISTED_FIELDS:
+            value = saved.get(name)
+            if isinstance(value, dict):
+                setattr(self.state, name, value)
+
+    def _save_state(self) -> None:
+        snapshot = {name: getattr(self.state, name) for name in _PERSISTED_FIELDS}
+        # Never write the API key to disk
+        snapshot["headers"] = {k: v for k, v in self.state.headers.items() if k.lower() != "x-api-key"}
+        # Create the temp file owner-only and swap it in, so the state is never briefly world-readable
+        tmp_path = _STATE_PATH.with_name(f"{_STATE_PATH.name}.tmp")
+        try:
+            body = orjson.dumps(snapshot, option=orjson.OPT_NON_STR_KEYS)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(body)
+            os.replace(tmp_path, _STATE_PATH)
+        except (OSError, TypeError) as exc:
+            print(f"Unable to save UI state: {exc}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _ask(self, message: str, default: str = "", remember: bool = True) -> str:
+        """Prompt for a line of input, pre-filling ``default`` when prompt_toolkit is available.
+
+        Pass ``remember=False`` for secrets so they never reach the history file.
+        """
+        if self._session is not None and remember:
+            return self._session.prompt(message, default=default).strip()
+        return input(message).strip() or default
+
     def _print_menu(self) -> None:
-        print(
-            """
-=================== Brief2Bill Terminal UI ===================
- 1) GET  /v1/healthz
- 2) GET  /v1/providers
- 3) POST /v1/providers/select
- 4) GET  /v1/providers/active
- 5) POST /v1/draft
- 6) POST /v1/validate
- 7) POST /v1/repair
- 8) POST /v1/compute/totals
- 9) POST /v1/upi/deeplink
-10) POST /v1/generate/quotation
-11) POST /v1/generate/invoice
-12) POST /v1/generate/project-brief
- q) Quit
-==============================================================
-"""
-        )
+        sys.stdout.write(_MENU_TEXT)
+        sys.stdout.flush()
+
+    def _print_response(self, response: httpx.Response, decode: bool = False) -> Any:
+        """Print the response and return its decoded JSON body, or None if it is not JSON.
 
-    def _print_response(self, response: httpx.Response) -> None:
+        In raw mode the body is only decoded when ``decode`` is set.
+        """
         print(f"Status: {response.status_code}")
+        if not self.pretty:
+            self._write_raw(response.content)
+            if not decode:
+                return None
         try:
-            data = response.json()
-        except json.JSONDecodeError:
-            print(response.text)
-            return
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+            data = _json_loads(response.content)
+        except _JSON_DECODE_ERRORS:
+            if self.pretty:
+                print(response.text)
+            return None
+        if self.pretty:
+            print(orjson.dumps(data, option=_PRETTY_JSON).decode())
+        return data
+
+    @staticmethod
+    def _write_raw(body: bytes) -> None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(body)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+
+    def _post_bundle(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """POST ``payload`` and print the reply; returns the decoded bundle on HTTP 200."""
+        response = self.client.post(endpoint, json=payload)
+        data = self._print_response(response, decode=response.status_code == 200)
+        if response.status_code != 200:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _remember_bundle(self, bundle: Dict[str, Any]) -> None:
+        self.state.bundle = bundle
+        if bundle.get("drafts"):
+            self.state.draft = bundle["drafts"][0]
 
     def check_health(self) -> None:
         response = self.client.get("/v1/healthz")
         self._print_response(response)
 
     def list_providers(self) -> None:
+        # An explicit listing also drops the cached copy used by the generation prompts
+        self.state.providers_cache = None
+        self._providers_prefetch = None
         response = self.client.get("/v1/providers")
         self._print_response(response)
 
     def select_provider(self) -> None:
-        provider = input("Provider (openrouter/groq/openai/gemini): ").strip() or "openai"
-        model = input("Model identifier: ").strip() or "gpt-4o-mini"
-        workspace = input("Workspace id [default]: ").strip() or "default"
+        provider = self._ask("Provider (openrouter/groq/openai/gemini): ") or "openai"
+        model = self._ask("Model identifier: ") or "gpt-4o-mini"
+        workspace = self._ask("Workspace id [default]: ") or "default"
         response = self.client.post(
             "/v1/providers/select",
             json={"provider": provider, "model": model, "workspace_id": workspace},
         )
+        self.state.providers_cache = None
+        self._providers_prefetch = None
         self._print_response(response)
 
     def get_active_provider(self) -> None:
-        workspace = input("Workspace id [default]: ").strip() or "default"
+        workspace = self._ask("Workspace id [default]: ") or "default"
         response = self.client.get("/v1/providers/active", params={"workspace_id": workspace})
         self._print_response(response)
 
     def create_draft(self) -> None:
-        prompt = input("Requirement prompt: ").strip()
+        prompt = self._ask("Requirement prompt: ")
         if not prompt:
             print("Prompt is required. Aborting.")
             return
-        prefer = input("Preferred doc types (comma separated, optional): ").strip()
+        prefer = self._ask("Preferred doc types (comma separated, optional): ")
         prefer_list = [item.strip().upper() for item in prefer.split(",") if item.strip()] if prefer else None
-        currency = input("Currency [INR]: ").strip() or "INR"
-        provider = input("Override provider (blank to skip): ").strip() or None
-        model = input("Override model (blank to skip): ").strip() or None
-        workspace = input("Workspace id [default]: ").strip() or "default"
+        currency = self._ask("Currency [INR]: ") or "INR"
+        provider = self._ask("Override provider (blank to skip): ") or None
+        model = self._ask("Override model (blank to skip): ") or None
+        workspace = self._ask("Workspace id [default]: ") or "default"
 
         payload: Dict[str, Any] = {
             "prompt": prompt,
@@ -140,16 +302,9 @@ class TerminalUI:
         if model:
             payload["model"] = model
 
-        response = self.client.post("/v1/draft", json=payload)
-        self._print_response(response)
-        if response.status_code == 200:
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                return
-            self.state.bundle = data
-            if data.get("drafts"):
-                self.state.draft = data["drafts"][0]
+        data = self._post_bundle("/v1/draft", payload)
+        if data is not None:
+            self._remember_bundle(data)
 
     # ------------------------------------------------------------------
     # Generation endpoints
@@ -184,38 +339,26 @@ class TerminalUI:
         bundle = self._get_bundle_input(allow_empty=True)
         if bundle is None:
             return
-        response = self.client.post("/v1/repair", json={"bundle": bundle})
-        self._print_response(response)
-        if response.status_code == 200:
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                return
-            self.state.bundle = data
-            if data.get("drafts"):
-                self.state.draft = data["drafts"][0]
+        data = self._post_bundle("/v1/repair", {"bundle": bundle})
+        if data is not None:
+            self._remember_bundle(data)
 
     def compute_totals(self) -> None:
         draft = self._get_draft_input()
         if draft is None:
             return
         response = self.client.post("/v1/compute/totals", json={"draft": draft})
-        self._print_response(response)
-        if response.status_code == 200:
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                return
-            if "draft" in data:
-                self.state.draft = data["draft"]
+        data = self._print_response(response, decode=response.status_code == 200)
+        if response.status_code == 200 and isinstance(data, dict) and "draft" in data:
+            self.state.draft = data["draft"]
 
     def generate_upi(self) -> None:
-        upi_id = input("UPI ID: ").strip()
-        payee = input("Payee name: ").strip()
-        amount_text = input("Amount (blank to omit): ").strip()
-        note = input("Note (optional): ").strip()
-        txn_ref = input("Transaction ref (optional): ").strip()
-        callback = input("Callback URL (optional): ").strip()
+        upi_id = self._ask("UPI ID: ")
+        payee = self._ask("Payee name: ")
+        amount_text = self._ask("Amount (blank to omit): ")
+        note = self._ask("Note (optional): ")
+        txn_ref = self._ask("Transaction ref (optional): ")
+        callback = self._ask("Callback URL (optional): ")
         if not upi_id or not payee:
             print("UPI ID and Payee name are required.")
             return
@@ -235,46 +378,40 @@ class TerminalUI:
         response = self.client.post("/v1/upi/deeplink", json=payload)
         self._print_response(response)
 
-    def _get_bundle_input(self, allow_empty: bool = False) -> Optional[Dict[str, Any]]:
-        if self.state.bundle and allow_empty:
-            raw = input("Bundle JSON (Enter to use last bundle): ").strip()
+    def _get_json_input(self, label: str, state_attr: str, allow_empty: bool = False) -> Optional[Dict[str, Any]]:
+        """Prompt for a JSON object, offering the last ``state_attr`` value from ``self.state``."""
+        saved = getattr(self.state, state_attr)
+        if saved and allow_empty:
+            raw = self._ask(f"{label.capitalize()} JSON (Enter to use last {label}): ")
             if not raw:
-                return self.state.bundle
-        elif self.state.bundle:
-            use_saved = input("Use last bundle? [Y/n]: ").strip().lower()
-            if use_saved in {"", "y", "yes"}:
-                return self.state.bundle
-            raw = input("Bundle JSON: ").strip()
+                return saved
         else:
-            raw = input("Bundle JSON: ").strip()
+            if saved:
+                use_saved = self._ask(f"Use last {label}? [Y/n]: ").lower()
+                if use_saved in {"", "y", "yes"}:
+                    return saved
+            raw = self._ask(f"{label.capitalize()} JSON: ")
         if not raw:
-            print("No bundle supplied.")
+            print(f"No {label} supplied.")
             return None
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
+            return _json_loads(raw)
+        except _JSON_DECODE_ERRORS as exc:
             print(f"Invalid JSON: {exc}")
             return None
 
+    def _get_bundle_input(self, allow_empty: bool = False) -> Optional[Dict[str, Any]]:
+        return self._get_json_input("bundle", "bundle", allow_empty)
+
     def _get_draft_input(self) -> Optional[Dict[str, Any]]:
-        if self.state.draft:
-            use_saved = input("Use last draft? [Y/n]: ").strip().lower()
-            if use_saved in {"", "y", "yes"}:
-                return self.state.draft
-        raw = input("Draft JSON: ").strip()
-        if not raw:
-            print("No draft supplied.")
-            return None
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
-            print(f"Invalid JSON: {exc}")
-            return None
+        return self._get_json_input("draft", "draft")
 
     # ------------------------------------------------------------------
     # Helpers for generation endpoints
 
     def _generate_with_payload(self, endpoint: str, default_payload: str) -> None:
+        # Overlap the provider listing request with the payload prompt and file read
+        self._prefetch_providers()
         payload = self._load_payload(default_payload)
         if payload is None:
             return
@@ -291,17 +428,26 @@ class TerminalUI:
     def _load_payload(self, default_payload: str) -> Optional[Dict[str, Any]]:
         default_path = self.samples_dir / default_payload
         prompt = f"Payload file path [default: {default_path}]: "
-        raw_path = input(prompt).strip()
+        raw_path = self._ask(prompt)
         path = Path(raw_path) if raw_path else default_path
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            mtime = path.stat().st_mtime
+            cached = self._payload_cache.get(path)
+            # Payloads are only serialised into requests, never mutated, so share the parsed dict
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            # Decode straight from bytes; no intermediate str copy of the file
+            data = _json_loads(path.read_bytes())
         except FileNotFoundError:
             print(f"File not found: {path}")
             return None
-        except json.JSONDecodeError as exc:
+        except OSError as exc:
+            print(f"Unable to read {path}: {exc}")
+            return None
+        except _JSON_DECODE_ERRORS as exc:
             print(f"Invalid JSON in {path}: {exc}")
             return None
+        self._payload_cache[path] = (mtime, data)
         return data
 
     def _prompt_headers(self) -> Optional[Dict[str, str]]:
@@ -320,50 +466,84 @@ class TerminalUI:
             headers["X-Model"] = model
 
         workspace = (
-            input(f"Workspace id [{workspace_default}]: ").strip() or workspace_default
+            self._ask(f"Workspace id [{workspace_default}]: ", default=workspace_default)
+            or workspace_default
         )
         if not workspace:
             print("Workspace id is required.")
             return None
         headers["X-Workspace-Id"] = workspace
 
-        api_key = input("x-api-key (blank to omit): ").strip() or api_key_default
+        api_key = self._ask("x-api-key (blank to omit): ", remember=False) or api_key_default
         if api_key:
             headers["x-api-key"] = api_key
 
         self.state.headers = headers
         return headers
 
-    def _maybe_pick_provider(
-        self, provider: Optional[str], model: Optional[str]
-    ) -> Tuple[Optional[str], Optional[str]]:
-        choice = input("Load enabled providers from API? [Y/n]: ").strip().lower()
-        if choice not in {"", "y", "yes"}:
-            manual_provider = input(
-                f"X-Provider override ({provider or 'leave blank'}): "
-            ).strip()
-            manual_model = input(f"X-Model override ({model or 'leave blank'}): ").strip()
-            return (
-                manual_provider or provider,
-                manual_model or model,
-            )
+    def _cached_providers(self) -> Optional[List[Dict[str, Any]]]:
+        cached = self.state.providers_cache
+        if cached is not None and time.monotonic() - cached[0] < _PROVIDERS_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _prefetch_providers(self) -> None:
+        if self._providers_prefetch is None and self._cached_providers() is None:
+            self._providers_prefetch = self._executor.submit(self._fetch_providers)
 
+    def _fetch_providers(self) -> Tuple[float, httpx.Response]:
+        """GET /v1/providers, stamped with the monotonic time the reply arrived."""
+        response = self.client.get("/v1/providers")
+        return time.monotonic(), response
+
+    def _enabled_providers(self) -> Optional[List[Dict[str, Any]]]:
+        """Return enabled providers, reusing a listing fetched within the TTL."""
+        cached = self._cached_providers()
+        if cached is not None:
+            return cached
+
+        prefetch, self._providers_prefetch = self._providers_prefetch, None
         try:
-            response = self.client.get("/v1/providers")
+            fetched_at, response = prefetch.result() if prefetch is not None else self._fetch_providers()
+            # A prefetch left unused past the TTL is as stale as an expired cache entry
+            if time.monotonic() - fetched_at >= _PROVIDERS_CACHE_TTL:
+                fetched_at, response = self._fetch_providers()
             response.raise_for_status()
         except httpx.HTTPError as exc:
             print(f"Unable to load providers: {exc}")
-            return provider, model
+            return None
 
         try:
-            data = response.json()
-        except json.JSONDecodeError as exc:
+            data = _json_loads(response.content)
+        except _JSON_DECODE_ERRORS as exc:
             print(f"Invalid provider response: {exc}")
-            return provider, model
+            return None
 
         providers = [
             p for p in data.get("providers", []) if p.get("enabled")
         ]
+        self.state.providers_cache = (fetched_at, providers)
+        return providers
+
+    def _ask_model_override(self, model: Optional[str]) -> Optional[str]:
+        return self._ask(f"X-Model override ({model or 'leave blank'}): ") or model
+
+    def _manual_override(
+        self, provider: Optional[str], model: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        manual_provider = self._ask(f"X-Provider override ({provider or 'leave blank'}): ")
+        return manual_provider or provider, self._ask_model_override(model)
+
+    def _maybe_pick_provider(
+        self, provider: Optional[str], model: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        choice = self._ask("Load enabled providers from API? [Y/n]: ").lower()
+        if choice not in {"", "y", "yes"}:
+            return self._manual_override(provider, model)
+
+        providers = self._enabled_providers()
+        if providers is None:
+            return provider, model
         if not providers:
             print("No enabled providers available. Falling back to manual entry.")
             return provider, model
@@ -371,30 +551,16 @@ class TerminalUI:
         for idx, prov in enumerate(providers, start=1):
             print(f"{idx}) {prov.get('name')} ({len(prov.get('models', []))} models)")
 
-        selection = input("Select provider number (blank to skip): ").strip()
+        selection = self._ask("Select provider number (blank to skip): ")
         if not selection:
-            manual_provider = input(
-                f"X-Provider override ({provider or 'leave blank'}): "
-            ).strip()
-            manual_model = input(f"X-Model override ({model or 'leave blank'}): ").strip()
-            return (
-                manual_provider or provider,
-                manual_model or model,
-            )
+            return self._manual_override(provider, model)
 
         try:
             provider_index = int(selection) - 1
             chosen = providers[provider_index]
         except (ValueError, IndexError):
             print("Invalid selection. Falling back to manual entry.")
-            manual_provider = input(
-                f"X-Provider override ({provider or 'leave blank'}): "
-            ).strip()
-            manual_model = input(f"X-Model override ({model or 'leave blank'}): ").strip()
-            return (
-                manual_provider or provider,
-                manual_model or model,
-            )
+            return self._manual_override(provider, model)
 
         provider_name = chosen.get("name")
         models = chosen.get("models", [])
@@ -402,8 +568,7 @@ class TerminalUI:
             print(
                 f"Provider {provider_name} has no models listed. Enter model manually."
             )
-            manual_model = input(f"X-Model override ({model or 'leave blank'}): ").strip()
-            return provider_name, manual_model or model
+            return provider_name, self._ask_model_override(model)
 
         for idx, model_entry in enumerate(models, start=1):
             model_id = model_entry.get("id")
@@ -411,7 +576,7 @@ class TerminalUI:
             label = model_id if not family else f"{model_id} ({family})"
             print(f"  {idx}) {label}")
 
-        model_selection = input("Select model number (blank to keep previous): ").strip()
+        model_selection = self._ask("Select model number (blank to keep previous): ")
         chosen_model = model
         if model_selection:
             try:
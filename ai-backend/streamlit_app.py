@@ -3,12 +3,29 @@ Streamlit Web UI for Brief2Bill API Testing
 A beautiful, interactive interface for testing document generation endpoints.
 """
 
-import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:  # HTTP/2 needs the optional h2 package (installed via httpx[http2])
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
+try:  # ijson lets generation replies be parsed while they download
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
 # Page configuration
 st.set_page_config(
@@ -19,7 +36,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -59,45 +76,335 @@ st.markdown("""
         color: #0c5460;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Static selectbox options
+_CURRENCIES = ("INR", "USD", "EUR", "GBP")
+_LOCALES = ("en-IN", "en-US", "en-GB")
+_PAYMENT_MODES = ("MILESTONE", "HOURLY", "FIXED_PRICE", "RETAINER")
+
+# Section header HTML, formatted once per title
+_SECTION_HEADERS = {
+    title: f'<div class="section-header">{title}</div>'
+    for title in (
+        "Generate Quotation",
+        "Document Details",
+        "Requirement Description",
+        "Optional: Manual Line Items",
+        "Generate Tax Invoice",
+        "Generate Project Brief",
+        "Project Details",
+        "Project Requirement",
+        "Engagement Terms",
+        "Optional: Key Deliverables/Milestones",
+        "Last API Response",
+    )
+}
+
+
+@st.cache_resource
+def _inject_css() -> None:
+    # Element calls inside cached functions are replayed on later reruns
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+
+def _section_header(title: str) -> None:
+    header = _SECTION_HEADERS.get(title) or f'<div class="section-header">{title}</div>'
+    st.markdown(header, unsafe_allow_html=True)
+
+
+_inject_css()
 
 # Initialize session state
 if 'api_url' not in st.session_state:
     st.session_state.api_url = "http://localhost:8000"
 if 'api_key' not in st.session_state:
     st.session_state.api_key = ""
-if 'last_response' not in st.session_state:
-    st.session_state.last_response = None
+if 'last_response_text' not in st.session_state:
+    st.session_state.last_response_text = ""
 if 'provider' not in st.session_state:
     st.session_state.provider = "groq"
 if 'model' not in st.session_state:
     st.session_state.model = "llama-3.3-70b-versatile"
 
+# Widget default dates are derived once per day instead of at every date_input
+today = date.today()
+if st.session_state.get('_today') != today:
+    st.session_state._today = today
+    st.session_state._default_dates = {days: today + timedelta(days=days) for days in (7, 15, 21, 30)}
+default_dates: Dict[int, date] = st.session_state._default_dates
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Pooled client shared across reruns and sessions so connections stay warm."""
+    return httpx.Client(
+        timeout=60.0,
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
 
-def make_request(endpoint: str, method: str = "GET", data: Optional[Dict] = None, headers: Optional[Dict] = None) -> tuple:
-    """Make HTTP request to the API."""
-    url = f"{st.session_state.api_url}{endpoint}"
-    
+
+def _request_headers(headers: Optional[Dict] = None) -> Dict[str, str]:
     request_headers = {}
     if st.session_state.api_key:
         request_headers["X-API-Key"] = st.session_state.api_key
     if headers:
         request_headers.update(headers)
-    
+    return request_headers
+
+
+def make_request(endpoint: str, method: str = "GET", data: Optional[Dict] = None, headers: Optional[Dict] = None) -> tuple:
+    """Make HTTP request to the API."""
+    url = f"{st.session_state.api_url}{endpoint}"
+    request_headers = _request_headers(headers)
+
+    client = get_http_client()
     try:
-        with httpx.Client(timeout=60.0) as client:
-            if method == "GET":
-                response = client.get(url, headers=request_headers)
-            elif method == "POST":
-                response = client.post(url, json=data, headers=request_headers)
-            else:
-                return None, f"Unsupported method: {method}"
-            
-            return response, None
+        if method == "GET":
+            response = client.get(url, headers=request_headers)
+        elif method == "POST":
+            response = client.post(url, json=data, headers=request_headers)
+        else:
+            return None, f"Unsupported method: {method}"
+
+        return response, None
     except Exception as e:
         return None, str(e)
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_get(api_url: str, api_key: str, endpoint: str) -> Tuple[int, Any]:
+    """GET an idempotent metadata endpoint, returning plain (status_code, json_body) data.
+
+    Network errors raise and are therefore never cached.
+    """
+    request_headers = {"X-API-Key": api_key} if api_key else {}
+    response = get_http_client().get(f"{api_url}{endpoint}", headers=request_headers)
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    return response.status_code, body
+
+
+def cached_get_many(
+    endpoints: Sequence[str], total_timeout: Optional[float] = None
+) -> List[Tuple[Optional[int], Any, Optional[str]]]:
+    """Return (status_code, json_body, error) for several GETs at once, in endpoint order.
+
+    Every lookup goes through _cached_get, so hits skip the network and misses fill the
+    shared cache. Lookups still running when ``total_timeout`` expires report a timeout.
+    """
+    api_url, api_key = st.session_state.api_url, st.session_state.api_key
+    ctx = get_script_run_ctx()
+
+    def _lookup(endpoint: str) -> Tuple[int, Any]:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return _cached_get(api_url, api_key, endpoint)
+
+    pool = ThreadPoolExecutor(max_workers=max(len(endpoints), 1))
+    futures = [pool.submit(_lookup, endpoint) for endpoint in endpoints]
+    done, _ = wait(futures, timeout=total_timeout)
+    # Late fetches finish in the background and still land in the cache
+    pool.shutdown(wait=False)
+
+    results: List[Tuple[Optional[int], Any, Optional[str]]] = []
+    for future in futures:
+        if future not in done:
+            results.append((None, None, f"Timed out after {total_timeout}s"))
+            continue
+        try:
+            status_code, body = future.result()
+        except Exception as e:
+            results.append((None, None, str(e)))
+            continue
+        results.append((status_code, body, None))
+    return results
+
+
+class _GenerationCache:
+    """Bounded TTL store of successful generation replies as (status, body, headers)."""
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[float, Tuple[int, bytes, Dict[str, str]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Tuple[int, bytes, Dict[str, str]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: tuple, reply: Tuple[int, bytes, Dict[str, str]]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), reply)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@st.cache_resource
+def _generation_cache() -> _GenerationCache:
+    # Shared across reruns and sessions; streaming and progress output stay outside it
+    return _GenerationCache(ttl=3600.0, max_entries=32)
+
+
+def _post_streamed(
+    url: str, content: bytes, headers: Dict[str, str], on_item: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Tuple[int, bytes, Dict[str, str]]:
+    """POST and read the reply in chunks; with ijson installed, ``on_item`` gets each line item as it parses."""
+    with get_http_client().stream("POST", url, content=content, headers=headers) as response:
+        content_type = response.headers.get("content-type", "")
+        parsed_items = parser = None
+        if on_item is not None and ijson is not None and "json" in content_type:
+            parsed_items = ijson.sendable_list()
+            parser = ijson.items_coro(parsed_items, "items.item", use_float=True)
+        chunks = []
+        for chunk in response.iter_bytes():
+            chunks.append(chunk)
+            if parser is None:
+                continue
+            try:
+                parser.send(chunk)
+            except ijson.JSONError:
+                # Progress is best effort; the full body is still decoded afterwards
+                parser = None
+                continue
+            for item in parsed_items:
+                on_item(item)
+            del parsed_items[:]
+        return response.status_code, b"".join(chunks), {"content-type": content_type}
+
+
+def cached_generate(
+    endpoint: str,
+    payload: Dict[str, Any],
+    force_refresh: bool = False,
+    on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> tuple:
+    """Generate via the API, reusing the reply for identical inputs for an hour; returns (response, error).
+
+    Only 200 replies are remembered, and ``on_item`` runs only when the request is actually sent.
+    """
+    cache = _generation_cache()
+    if force_refresh:
+        cache.clear()
+    payload_bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    api_url, api_key = st.session_state.api_url, st.session_state.api_key
+    provider, model = st.session_state.provider, st.session_state.model
+    key = (api_url, api_key, endpoint, provider, model, payload_bytes)
+
+    reply = cache.get(key)
+    if reply is None:
+        request_headers = {"Content-Type": "application/json", "X-Provider": provider, "X-Model": model}
+        if api_key:
+            request_headers["X-API-Key"] = api_key
+        try:
+            reply = _post_streamed(f"{api_url}{endpoint}", payload_bytes, request_headers, on_item)
+        except Exception as e:
+            return None, str(e)
+        if reply[0] == 200:
+            cache.put(key, reply)
+
+    status_code, content, headers = reply
+    return httpx.Response(status_code, content=content, headers=headers), None
+
+
+def _line1(address: str) -> str:
+    """First comma-separated segment of an address (the whole string when there is no comma)."""
+    return address.partition(',')[0]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_party(name: str, email: str, phone: str, gstin: str, address: str, city: str, state: str, **fields: Any) -> Dict[str, Any]:
+    """Build a party block for the request payload; ``fields`` adds pan, bank, tax_prefs, etc."""
+    party = {
+        "name": name,
+        "email": email,
+        "phone": phone,
+        "gstin": gstin,
+        "billing_address": {
+            "line1": _line1(address),
+            "city": city,
+            "state": state,
+            "country": "India"
+        },
+    }
+    party.update(fields)
+    return party
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_hints(
+    doc_meta: Dict[str, str], dates: Dict[str, str], items: List[Dict[str, Any]], payment: Dict[str, str], terms: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build the ``hints`` block; dates are ISO strings so identical widget states share a cache entry."""
+    hints = {"doc_meta": doc_meta, "dates": dates, "items": items}
+    if terms is not None:
+        hints["terms"] = terms
+    hints["payment"] = payment
+    return hints
+
+
+# Column setup shared by the line-item grids
+_ITEM_COLUMNS = {
+    "description": st.column_config.TextColumn("Description"),
+    "qty": st.column_config.NumberColumn("Quantity", min_value=0.0),
+    "unit": st.column_config.TextColumn("Unit"),
+    "unit_price": st.column_config.NumberColumn("Unit Price", min_value=0.0),
+    "hsn_sac": st.column_config.TextColumn("HSN/SAC"),
+    "tax_rate": st.column_config.NumberColumn("Tax Rate (%)", min_value=0.0, max_value=100.0),
+}
+
+
+def line_items_editor(
+    key: str, default_rows: List[Dict[str, Any]], labels: Optional[Dict[str, str]] = None, **fixed: Any
+) -> List[Dict[str, Any]]:
+    """Edit line items in one data_editor grid; ``fixed`` supplies values for columns not shown.
+
+    Rows without a description are dropped and blank cells fall back to ``fixed`` or the API default.
+    """
+    column_config = {column: _ITEM_COLUMNS[column] for column in default_rows[0] if column in _ITEM_COLUMNS}
+    for column, label in (labels or {}).items():
+        column_config[column] = st.column_config.NumberColumn(label, min_value=0.0)
+    edited = st.data_editor(
+        default_rows,
+        num_rows="dynamic",
+        column_config=column_config,
+        use_container_width=True,
+        key=key,
+    )
+    return [
+        {**fixed, **{column: value for column, value in row.items() if value is not None}}
+        for row in edited
+        if row.get("description")
+    ]
+
+
+def item_progress() -> Tuple[Callable[[Dict[str, Any]], None], Any]:
+    """Return an on_item callback that lists streamed line items, and the placeholder it writes to."""
+    placeholder = st.empty()
+    received: List[str] = []
+
+    def on_item(item: Dict[str, Any]) -> None:
+        received.append(f"- {item.get('description', '')}")
+        placeholder.markdown(f"**Line items received ({len(received)}):**\n" + "\n".join(received))
+
+    return on_item, placeholder
+
+
 def display_response(response):
     """Display API response in a formatted way."""
     if response is None:
@@ -110,14 +417,22 @@ def display_response(response):
     else:
         st.markdown(f'<div class="error-box">❌ Request Failed: {response.status_code}</div>', unsafe_allow_html=True)
     
+    # Only JSON bodies are parsed, so plain-text and HTML errors skip the decode-and-raise path
+    if not response.content or "json" not in response.headers.get("content-type", ""):
+        st.code(response.text)
+        return None
+
     try:
-        json_data = response.json()
-        st.json(json_data)
-        st.session_state.last_response = json_data
-        return json_data
-    except:
+        json_data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         st.code(response.text)
         return None
+    # Encode once with orjson; st.json takes the string as-is and the download reuses it
+    pretty = orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode()
+    st.json(pretty)
+    # Only the formatted text is kept per session; the tab renders and downloads it directly
+    st.session_state.last_response_text = pretty
+    return json_data
 
 
 # Sidebar - Configuration
@@ -136,35 +451,39 @@ with st.sidebar:
         type="password",
         help="Leave blank if API key is not required"
     )
+
+    # Cached metadata belongs to the previous server/credentials once either changes
+    connection = (st.session_state.api_url, st.session_state.api_key)
+    if st.session_state.get("_connection") != connection:
+        _cached_get.clear()
+        st.session_state._connection = connection
     
     st.markdown("---")
     
     # Health Check
     st.markdown("### 🏥 Health Check")
-    if st.button("Check API Health", use_container_width=True):
-        response, error = make_request("/v1/healthz")
-        if error:
-            st.error(f"Error: {error}")
-        elif response:
-            if response.status_code == 200:
-                st.success("✅ API is healthy!")
-            else:
-                st.error(f"❌ API returned status {response.status_code}")
+    if st.button("Refresh Health & Providers", use_container_width=True):
+        # One concurrent batch through the metadata cache instead of two sequential round trips
+        (health_status, _, health_error), (providers_status, providers_data, providers_error) = cached_get_many(
+            ["/v1/healthz", "/v1/providers"], total_timeout=3.0
+        )
+        if health_error:
+            st.error(f"Error: {health_error}")
+        elif health_status == 200:
+            st.success("✅ API is healthy!")
+        else:
+            st.error(f"❌ API returned status {health_status}")
+        if providers_error:
+            st.error(f"Error: {providers_error}")
+        elif providers_status == 200 and isinstance(providers_data, dict):
+            st.session_state.providers_list = providers_data.get("providers", [])
+            st.success("Providers loaded!")
     
     st.markdown("---")
     
     # Provider Selection
     st.markdown("### 🤖 AI Provider")
     
-    if st.button("Fetch Providers", use_container_width=True):
-        response, error = make_request("/v1/providers")
-        if error:
-            st.error(f"Error: {error}")
-        elif response and response.status_code == 200:
-            providers_data = response.json()
-            st.session_state.providers_list = providers_data.get("providers", [])
-            st.success("Providers loaded!")
-    
     if 'providers_list' in st.session_state:
         provider_names = [p["name"] for p in st.session_state.providers_list]
         selected_provider = st.selectbox(
@@ -200,148 +519,103 @@ tab1, tab2, tab3, tab4 = st.tabs(["📋 Quotation", "🧾 Invoice", "📝 Projec
 
 # Tab 1: Quotation Generator
 with tab1:
-    st.markdown('<div class="section-header">Generate Quotation</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### 👤 Seller Information")
-        seller_name = st.text_input("Company Name*", value="Acme Solutions Pvt Ltd", key="seller_name")
-        seller_email = st.text_input("Email*", value="sales@acmesolutions.in", key="seller_email")
-        seller_phone = st.text_input("Phone*", value="+91-9800000000", key="seller_phone")
-        seller_gstin = st.text_input("GSTIN", value="24ABCDE1234F1Z5", key="seller_gstin")
-        seller_pan = st.text_input("PAN", value="ABCDE1234F", key="seller_pan")
-        seller_address = st.text_area(
-            "Address*",
-            value="401, Skyline Tech Park, City Light Road, Surat, Gujarat, 395007, India",
-            key="seller_address"
+    _section_header("Generate Quotation")
+
+    # Inputs are batched in a form so editing them does not rerun the script
+    with st.form("quotation_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### 👤 Seller Information")
+            seller_name = st.text_input("Company Name*", value="Acme Solutions Pvt Ltd", key="seller_name")
+            seller_email = st.text_input("Email*", value="sales@acmesolutions.in", key="seller_email")
+            seller_phone = st.text_input("Phone*", value="+91-9800000000", key="seller_phone")
+            seller_gstin = st.text_input("GSTIN", value="24ABCDE1234F1Z5", key="seller_gstin")
+            seller_pan = st.text_input("PAN", value="ABCDE1234F", key="seller_pan")
+            seller_address = st.text_area(
+                "Address*",
+                value="401, Skyline Tech Park, City Light Road, Surat, Gujarat, 395007, India",
+                key="seller_address"
+            )
+            seller_upi = st.text_input("UPI ID", value="acmesolutions@upi", key="seller_upi")
+
+        with col2:
+            st.markdown("#### 🏢 Buyer Information")
+            buyer_name = st.text_input("Company Name*", value="Indigo Retail Pvt Ltd", key="buyer_name")
+            buyer_email = st.text_input("Email*", value="procurement@indigoretail.in", key="buyer_email")
+            buyer_phone = st.text_input("Phone*", value="+91-9810000000", key="buyer_phone")
+            buyer_gstin = st.text_input("GSTIN", value="27PQRSX1234A1Z2", key="buyer_gstin")
+            buyer_pan = st.text_input("PAN", value="PQRSX1234A", key="buyer_pan")
+            buyer_address = st.text_area(
+                "Address*",
+                value="5th Floor, Horizon Plaza, Nariman Point, Mumbai, Maharashtra, 400021, India",
+                key="buyer_address"
+            )
+
+        _section_header("Document Details")
+
+        col3, col4, col5 = st.columns(3)
+        with col3:
+            doc_no = st.text_input("Quotation Number", value="QTN-2025-0008", key="doc_no")
+            currency = st.selectbox("Currency", _CURRENCIES, index=0, key="currency")
+        with col4:
+            ref_no = st.text_input("Reference Number", value="", key="ref_no")
+            locale = st.selectbox("Locale", _LOCALES, index=0, key="locale")
+        with col5:
+            issue_date = st.date_input("Issue Date", value=today, key="issue_date")
+            valid_till = st.date_input("Valid Till", value=default_dates[21], key="valid_till")
+
+        _section_header("Requirement Description")
+        requirement = st.text_area(
+            "Describe what you need (AI will generate line items)*",
+            value="Quotation for redesigning Indigo Retail's e-commerce storefront with optional maintenance retainer.",
+            height=100,
+            key="requirement"
         )
-        seller_upi = st.text_input("UPI ID", value="acmesolutions@upi", key="seller_upi")
-    
-    with col2:
-        st.markdown("#### 🏢 Buyer Information")
-        buyer_name = st.text_input("Company Name*", value="Indigo Retail Pvt Ltd", key="buyer_name")
-        buyer_email = st.text_input("Email*", value="procurement@indigoretail.in", key="buyer_email")
-        buyer_phone = st.text_input("Phone*", value="+91-9810000000", key="buyer_phone")
-        buyer_gstin = st.text_input("GSTIN", value="27PQRSX1234A1Z2", key="buyer_gstin")
-        buyer_pan = st.text_input("PAN", value="PQRSX1234A", key="buyer_pan")
-        buyer_address = st.text_area(
-            "Address*",
-            value="5th Floor, Horizon Plaza, Nariman Point, Mumbai, Maharashtra, 400021, India",
-            key="buyer_address"
+
+        _section_header("Optional: Manual Line Items")
+
+        items = line_items_editor(
+            "items_quo",
+            [
+                {"description": f"Item {i}", "qty": 1.0, "unit": "pcs", "unit_price": 1000.0, "hsn_sac": "", "tax_rate": 18.0}
+                for i in (1, 2)
+            ],
+            discount=0,
         )
-    
-    st.markdown('<div class="section-header">Document Details</div>', unsafe_allow_html=True)
-    
-    col3, col4, col5 = st.columns(3)
-    with col3:
-        doc_no = st.text_input("Quotation Number", value="QTN-2025-0008", key="doc_no")
-        currency = st.selectbox("Currency", ["INR", "USD", "EUR", "GBP"], index=0, key="currency")
-    with col4:
-        ref_no = st.text_input("Reference Number", value="", key="ref_no")
-        locale = st.selectbox("Locale", ["en-IN", "en-US", "en-GB"], index=0, key="locale")
-    with col5:
-        issue_date = st.date_input("Issue Date", value=date.today(), key="issue_date")
-        valid_till = st.date_input("Valid Till", value=date.today() + timedelta(days=21), key="valid_till")
-    
-    st.markdown('<div class="section-header">Requirement Description</div>', unsafe_allow_html=True)
-    requirement = st.text_area(
-        "Describe what you need (AI will generate line items)*",
-        value="Quotation for redesigning Indigo Retail's e-commerce storefront with optional maintenance retainer.",
-        height=100,
-        key="requirement"
-    )
-    
-    st.markdown('<div class="section-header">Optional: Manual Line Items</div>', unsafe_allow_html=True)
-    
-    num_items = st.number_input("Number of line items", min_value=0, max_value=10, value=2, key="num_items")
-    
-    items = []
-    for i in range(int(num_items)):
-        with st.expander(f"Item {i+1}", expanded=(i==0)):
-            item_col1, item_col2, item_col3 = st.columns(3)
-            with item_col1:
-                desc = st.text_input("Description", value=f"Item {i+1}", key=f"item_desc_{i}")
-                qty = st.number_input("Quantity", min_value=0.0, value=1.0, key=f"item_qty_{i}")
-            with item_col2:
-                unit = st.text_input("Unit", value="pcs", key=f"item_unit_{i}")
-                unit_price = st.number_input("Unit Price", min_value=0.0, value=1000.0, key=f"item_price_{i}")
-            with item_col3:
-                hsn_sac = st.text_input("HSN/SAC", value="", key=f"item_hsn_{i}")
-                tax_rate = st.number_input("Tax Rate (%)", min_value=0.0, max_value=100.0, value=18.0, key=f"item_tax_{i}")
-            
-            items.append({
-                "description": desc,
-                "qty": qty,
-                "unit": unit,
-                "unit_price": unit_price,
-                "discount": 0,
-                "tax_rate": tax_rate,
-                "hsn_sac": hsn_sac
-            })
-    
-    st.markdown("---")
-    
-    if st.button("🚀 Generate Quotation", type="primary", use_container_width=True):
+
+        st.markdown("---")
+
+        quo_force = st.checkbox("Force refresh (ignore cached response)", key="quo_force")
+        quo_submitted = st.form_submit_button("🚀 Generate Quotation", type="primary", use_container_width=True)
+
+    if quo_submitted:
         # Build request payload
         payload = {
-            "from": {
-                "name": seller_name,
-                "email": seller_email,
-                "phone": seller_phone,
-                "gstin": seller_gstin,
-                "pan": seller_pan,
-                "billing_address": {
-                    "line1": seller_address.split(',')[0] if ',' in seller_address else seller_address,
-                    "city": "Surat",
-                    "state": "Gujarat",
-                    "country": "India"
-                },
-                "bank": {
-                    "upi_id": seller_upi
-                } if seller_upi else None
-            },
-            "to": {
-                "name": buyer_name,
-                "email": buyer_email,
-                "phone": buyer_phone,
-                "gstin": buyer_gstin,
-                "pan": buyer_pan,
-                "billing_address": {
-                    "line1": buyer_address.split(',')[0] if ',' in buyer_address else buyer_address,
-                    "city": "Mumbai",
-                    "state": "Maharashtra",
-                    "country": "India"
-                }
-            },
+            "from": build_party(
+                seller_name, seller_email, seller_phone, seller_gstin, seller_address, "Surat", "Gujarat",
+                pan=seller_pan,
+                bank={"upi_id": seller_upi} if seller_upi else None,
+            ),
+            "to": build_party(
+                buyer_name, buyer_email, buyer_phone, buyer_gstin, buyer_address, "Mumbai", "Maharashtra",
+                pan=buyer_pan,
+            ),
             "currency": currency,
             "locale": locale,
             "requirement": requirement,
-            "hints": {
-                "doc_meta": {
-                    "doc_no": doc_no,
-                    "ref_no": ref_no,
-                    "po_no": ""
-                },
-                "dates": {
-                    "issue_date": issue_date.isoformat(),
-                    "valid_till": valid_till.isoformat()
-                },
-                "items": items if num_items > 0 else [],
-                "payment": {
-                    "mode": "UPI",
-                    "instructions": "Pay 50% advance to initiate the project"
-                }
-            }
-        }
-        
-        headers = {
-            "X-Provider": st.session_state.provider,
-            "X-Model": st.session_state.model
+            "hints": build_hints(
+                {"doc_no": doc_no, "ref_no": ref_no, "po_no": ""},
+                {"issue_date": issue_date.isoformat(), "valid_till": valid_till.isoformat()},
+                items,
+                {"mode": "UPI", "instructions": "Pay 50% advance to initiate the project"},
+            ),
         }
         
+        on_item, progress = item_progress()
         with st.spinner("🤖 Generating quotation with AI..."):
-            response, error = make_request("/v1/generate/quotation", method="POST", data=payload, headers=headers)
+            response, error = cached_generate("/v1/generate/quotation", payload, force_refresh=quo_force, on_item=on_item)
+            progress.empty()
             
             if error:
                 st.error(f"❌ Error: {error}")
@@ -351,157 +625,108 @@ with tab1:
 
 # Tab 2: Invoice Generator
 with tab2:
-    st.markdown('<div class="section-header">Generate Tax Invoice</div>', unsafe_allow_html=True)
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("#### 👤 Seller Information")
-        inv_seller_name = st.text_input("Company Name*", value="Acme Solutions Pvt Ltd", key="inv_seller_name")
-        inv_seller_email = st.text_input("Email*", value="billing@acmesolutions.in", key="inv_seller_email")
-        inv_seller_phone = st.text_input("Phone*", value="+91-9800000000", key="inv_seller_phone")
-        inv_seller_gstin = st.text_input("GSTIN", value="24ABCDE1234F1Z5", key="inv_seller_gstin")
-        inv_seller_pan = st.text_input("PAN", value="ABCDE1234F", key="inv_seller_pan")
-        inv_seller_cin = st.text_input("CIN", value="U72900GJ2010PTC000123", key="inv_seller_cin")
-        inv_seller_address = st.text_area(
-            "Address*",
-            value="401, Skyline Tech Park, City Light Road, Surat, Gujarat, 395007, India",
-            key="inv_seller_address"
+    _section_header("Generate Tax Invoice")
+
+    # Inputs are batched in a form so editing them does not rerun the script
+    with st.form("invoice_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### 👤 Seller Information")
+            inv_seller_name = st.text_input("Company Name*", value="Acme Solutions Pvt Ltd", key="inv_seller_name")
+            inv_seller_email = st.text_input("Email*", value="billing@acmesolutions.in", key="inv_seller_email")
+            inv_seller_phone = st.text_input("Phone*", value="+91-9800000000", key="inv_seller_phone")
+            inv_seller_gstin = st.text_input("GSTIN", value="24ABCDE1234F1Z5", key="inv_seller_gstin")
+            inv_seller_pan = st.text_input("PAN", value="ABCDE1234F", key="inv_seller_pan")
+            inv_seller_cin = st.text_input("CIN", value="U72900GJ2010PTC000123", key="inv_seller_cin")
+            inv_seller_address = st.text_area(
+                "Address*",
+                value="401, Skyline Tech Park, City Light Road, Surat, Gujarat, 395007, India",
+                key="inv_seller_address"
+            )
+            inv_seller_upi = st.text_input("UPI ID", value="acmesolutions@upi", key="inv_seller_upi")
+
+        with col2:
+            st.markdown("#### 🏢 Buyer Information")
+            inv_buyer_name = st.text_input("Company Name*", value="Indigo Retail Pvt Ltd", key="inv_buyer_name")
+            inv_buyer_email = st.text_input("Email*", value="accounts@indigoretail.in", key="inv_buyer_email")
+            inv_buyer_phone = st.text_input("Phone*", value="+91-9810000000", key="inv_buyer_phone")
+            inv_buyer_gstin = st.text_input("GSTIN", value="27PQRSX1234A1Z2", key="inv_buyer_gstin")
+            inv_buyer_pan = st.text_input("PAN", value="PQRSX1234A", key="inv_buyer_pan")
+            inv_buyer_address = st.text_area(
+                "Address*",
+                value="5th Floor, Horizon Plaza, Nariman Point, Mumbai, Maharashtra, 400021, India",
+                key="inv_buyer_address"
+            )
+            inv_buyer_place_of_supply = st.text_input("Place of Supply", value="Maharashtra", key="inv_buyer_place")
+
+        _section_header("Document Details")
+
+        col3, col4, col5 = st.columns(3)
+        with col3:
+            inv_doc_no = st.text_input("Invoice Number*", value="INV-2025-0452", key="inv_doc_no")
+            inv_currency = st.selectbox("Currency", _CURRENCIES, index=0, key="inv_currency")
+        with col4:
+            inv_po_no = st.text_input("PO Number", value="INDIGO-PO-1122", key="inv_po_no")
+            inv_locale = st.selectbox("Locale", _LOCALES, index=0, key="inv_locale")
+        with col5:
+            inv_issue_date = st.date_input("Issue Date", value=today, key="inv_issue_date")
+            inv_due_date = st.date_input("Due Date", value=default_dates[15], key="inv_due_date")
+
+        _section_header("Requirement Description")
+        inv_requirement = st.text_area(
+            "Describe the invoice (AI will generate line items)*",
+            value="Invoice for website redesign project milestone completion.",
+            height=100,
+            key="inv_requirement"
         )
-        inv_seller_upi = st.text_input("UPI ID", value="acmesolutions@upi", key="inv_seller_upi")
-
-    with col2:
-        st.markdown("#### 🏢 Buyer Information")
-        inv_buyer_name = st.text_input("Company Name*", value="Indigo Retail Pvt Ltd", key="inv_buyer_name")
-        inv_buyer_email = st.text_input("Email*", value="accounts@indigoretail.in", key="inv_buyer_email")
-        inv_buyer_phone = st.text_input("Phone*", value="+91-9810000000", key="inv_buyer_phone")
-        inv_buyer_gstin = st.text_input("GSTIN", value="27PQRSX1234A1Z2", key="inv_buyer_gstin")
-        inv_buyer_pan = st.text_input("PAN", value="PQRSX1234A", key="inv_buyer_pan")
-        inv_buyer_address = st.text_area(
-            "Address*",
-            value="5th Floor, Horizon Plaza, Nariman Point, Mumbai, Maharashtra, 400021, India",
-            key="inv_buyer_address"
+
+        _section_header("Optional: Manual Line Items")
+
+        inv_items = line_items_editor(
+            "items_inv",
+            [
+                {"description": f"Service {i}", "qty": 1.0, "unit": "job", "unit_price": 28000.0, "hsn_sac": "998313", "tax_rate": 18.0}
+                for i in (1, 2)
+            ],
+            discount=0,
         )
-        inv_buyer_place_of_supply = st.text_input("Place of Supply", value="Maharashtra", key="inv_buyer_place")
-
-    st.markdown('<div class="section-header">Document Details</div>', unsafe_allow_html=True)
-
-    col3, col4, col5 = st.columns(3)
-    with col3:
-        inv_doc_no = st.text_input("Invoice Number*", value="INV-2025-0452", key="inv_doc_no")
-        inv_currency = st.selectbox("Currency", ["INR", "USD", "EUR", "GBP"], index=0, key="inv_currency")
-    with col4:
-        inv_po_no = st.text_input("PO Number", value="INDIGO-PO-1122", key="inv_po_no")
-        inv_locale = st.selectbox("Locale", ["en-IN", "en-US", "en-GB"], index=0, key="inv_locale")
-    with col5:
-        inv_issue_date = st.date_input("Issue Date", value=date.today(), key="inv_issue_date")
-        inv_due_date = st.date_input("Due Date", value=date.today() + timedelta(days=15), key="inv_due_date")
-
-    st.markdown('<div class="section-header">Requirement Description</div>', unsafe_allow_html=True)
-    inv_requirement = st.text_area(
-        "Describe the invoice (AI will generate line items)*",
-        value="Invoice for website redesign project milestone completion.",
-        height=100,
-        key="inv_requirement"
-    )
 
-    st.markdown('<div class="section-header">Optional: Manual Line Items</div>', unsafe_allow_html=True)
-
-    inv_num_items = st.number_input("Number of line items", min_value=0, max_value=10, value=2, key="inv_num_items")
-
-    inv_items = []
-    for i in range(int(inv_num_items)):
-        with st.expander(f"Item {i+1}", expanded=(i==0)):
-            inv_item_col1, inv_item_col2, inv_item_col3 = st.columns(3)
-            with inv_item_col1:
-                inv_desc = st.text_input("Description", value=f"Service {i+1}", key=f"inv_item_desc_{i}")
-                inv_qty = st.number_input("Quantity", min_value=0.0, value=1.0, key=f"inv_item_qty_{i}")
-            with inv_item_col2:
-                inv_unit = st.text_input("Unit", value="job", key=f"inv_item_unit_{i}")
-                inv_unit_price = st.number_input("Unit Price", min_value=0.0, value=28000.0, key=f"inv_item_price_{i}")
-            with inv_item_col3:
-                inv_hsn_sac = st.text_input("HSN/SAC", value="998313", key=f"inv_item_hsn_{i}")
-                inv_tax_rate = st.number_input("Tax Rate (%)", min_value=0.0, max_value=100.0, value=18.0, key=f"inv_item_tax_{i}")
-
-            inv_items.append({
-                "description": inv_desc,
-                "qty": inv_qty,
-                "unit": inv_unit,
-                "unit_price": inv_unit_price,
-                "discount": 0,
-                "tax_rate": inv_tax_rate,
-                "hsn_sac": inv_hsn_sac
-            })
+        st.markdown("---")
 
-    st.markdown("---")
+        inv_force = st.checkbox("Force refresh (ignore cached response)", key="inv_force")
+        inv_submitted = st.form_submit_button("🚀 Generate Invoice", type="primary", use_container_width=True)
 
-    if st.button("🚀 Generate Invoice", type="primary", use_container_width=True, key="gen_invoice_btn"):
+    if inv_submitted:
         # Build request payload
         inv_payload = {
-            "from": {
-                "name": inv_seller_name,
-                "email": inv_seller_email,
-                "phone": inv_seller_phone,
-                "gstin": inv_seller_gstin,
-                "pan": inv_seller_pan,
-                "cin": inv_seller_cin,
-                "billing_address": {
-                    "line1": inv_seller_address.split(',')[0] if ',' in inv_seller_address else inv_seller_address,
-                    "city": "Surat",
-                    "state": "Gujarat",
-                    "country": "India"
-                },
-                "bank": {
-                    "upi_id": inv_seller_upi
-                } if inv_seller_upi else None,
-                "tax_prefs": {
-                    "place_of_supply": "Gujarat",
-                    "reverse_charge": False,
-                    "e_invoice": True
-                }
-            },
-            "to": {
-                "name": inv_buyer_name,
-                "email": inv_buyer_email,
-                "phone": inv_buyer_phone,
-                "gstin": inv_buyer_gstin,
-                "pan": inv_buyer_pan,
-                "billing_address": {
-                    "line1": inv_buyer_address.split(',')[0] if ',' in inv_buyer_address else inv_buyer_address,
-                    "city": "Mumbai",
-                    "state": "Maharashtra",
-                    "country": "India"
-                },
-                "place_of_supply": inv_buyer_place_of_supply
-            },
+            "from": build_party(
+                inv_seller_name, inv_seller_email, inv_seller_phone, inv_seller_gstin, inv_seller_address, "Surat", "Gujarat",
+                pan=inv_seller_pan,
+                cin=inv_seller_cin,
+                bank={"upi_id": inv_seller_upi} if inv_seller_upi else None,
+                tax_prefs={"place_of_supply": "Gujarat", "reverse_charge": False, "e_invoice": True},
+            ),
+            "to": build_party(
+                inv_buyer_name, inv_buyer_email, inv_buyer_phone, inv_buyer_gstin, inv_buyer_address, "Mumbai", "Maharashtra",
+                pan=inv_buyer_pan,
+                place_of_supply=inv_buyer_place_of_supply,
+            ),
             "currency": inv_currency,
             "locale": inv_locale,
             "requirement": inv_requirement,
-            "hints": {
-                "doc_meta": {
-                    "doc_no": inv_doc_no,
-                    "po_no": inv_po_no,
-                    "ref_no": ""
-                },
-                "dates": {
-                    "issue_date": inv_issue_date.isoformat(),
-                    "due_date": inv_due_date.isoformat()
-                },
-                "items": inv_items if inv_num_items > 0 else [],
-                "payment": {
-                    "mode": "BANK_TRANSFER",
-                    "instructions": "Transfer to bank account or use UPI"
-                }
-            }
-        }
-
-        headers = {
-            "X-Provider": st.session_state.provider,
-            "X-Model": st.session_state.model
+            "hints": build_hints(
+                {"doc_no": inv_doc_no, "po_no": inv_po_no, "ref_no": ""},
+                {"issue_date": inv_issue_date.isoformat(), "due_date": inv_due_date.isoformat()},
+                inv_items,
+                {"mode": "BANK_TRANSFER", "instructions": "Transfer to bank account or use UPI"},
+            ),
         }
 
+        on_item, progress = item_progress()
         with st.spinner("🤖 Generating invoice with AI..."):
-            response, error = make_request("/v1/generate/invoice", method="POST", data=inv_payload, headers=headers)
+            response, error = cached_generate("/v1/generate/invoice", inv_payload, force_refresh=inv_force, on_item=on_item)
+            progress.empty()
 
             if error:
                 st.error(f"❌ Error: {error}")
@@ -511,169 +736,127 @@ with tab2:
 
 # Tab 3: Project Brief Generator
 with tab3:
-    st.markdown('<div class="section-header">Generate Project Brief</div>', unsafe_allow_html=True)
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("#### 👤 Service Provider Information")
-        pb_seller_name = st.text_input("Company Name*", value="Acme Solutions Pvt Ltd", key="pb_seller_name")
-        pb_seller_email = st.text_input("Email*", value="projects@acmesolutions.in", key="pb_seller_email")
-        pb_seller_phone = st.text_input("Phone*", value="+91-9800000000", key="pb_seller_phone")
-        pb_seller_gstin = st.text_input("GSTIN", value="24ABCDE1234F1Z5", key="pb_seller_gstin")
-        pb_seller_address = st.text_area(
-            "Address*",
-            value="401, Skyline Tech Park, City Light Road, Surat, Gujarat, 395007, India",
-            key="pb_seller_address"
-        )
-
-    with col2:
-        st.markdown("#### 🏢 Client Information")
-        pb_buyer_name = st.text_input("Company Name*", value="Indigo Retail Pvt Ltd", key="pb_buyer_name")
-        pb_buyer_email = st.text_input("Email*", value="ops@indigoretail.in", key="pb_buyer_email")
-        pb_buyer_phone = st.text_input("Phone*", value="+91-9810000000", key="pb_buyer_phone")
-        pb_buyer_gstin = st.text_input("GSTIN", value="27PQRSX1234A1Z2", key="pb_buyer_gstin")
-        pb_buyer_address = st.text_area(
-            "Address*",
-            value="5th Floor, Horizon Plaza, Nariman Point, Mumbai, Maharashtra, 400021, India",
-            key="pb_buyer_address"
+    _section_header("Generate Project Brief")
+
+    # Inputs are batched in a form so editing them does not rerun the script
+    with st.form("project_brief_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### 👤 Service Provider Information")
+            pb_seller_name = st.text_input("Company Name*", value="Acme Solutions Pvt Ltd", key="pb_seller_name")
+            pb_seller_email = st.text_input("Email*", value="projects@acmesolutions.in", key="pb_seller_email")
+            pb_seller_phone = st.text_input("Phone*", value="+91-9800000000", key="pb_seller_phone")
+            pb_seller_gstin = st.text_input("GSTIN", value="24ABCDE1234F1Z5", key="pb_seller_gstin")
+            pb_seller_address = st.text_area(
+                "Address*",
+                value="401, Skyline Tech Park, City Light Road, Surat, Gujarat, 395007, India",
+                key="pb_seller_address"
+            )
+
+        with col2:
+            st.markdown("#### 🏢 Client Information")
+            pb_buyer_name = st.text_input("Company Name*", value="Indigo Retail Pvt Ltd", key="pb_buyer_name")
+            pb_buyer_email = st.text_input("Email*", value="ops@indigoretail.in", key="pb_buyer_email")
+            pb_buyer_phone = st.text_input("Phone*", value="+91-9810000000", key="pb_buyer_phone")
+            pb_buyer_gstin = st.text_input("GSTIN", value="27PQRSX1234A1Z2", key="pb_buyer_gstin")
+            pb_buyer_address = st.text_area(
+                "Address*",
+                value="5th Floor, Horizon Plaza, Nariman Point, Mumbai, Maharashtra, 400021, India",
+                key="pb_buyer_address"
+            )
+
+        _section_header("Project Details")
+
+        col3, col4, col5 = st.columns(3)
+        with col3:
+            pb_currency = st.selectbox("Currency", _CURRENCIES, index=0, key="pb_currency")
+            pb_issue_date = st.date_input("Issue Date", value=today, key="pb_issue_date")
+        with col4:
+            pb_locale = st.selectbox("Locale", _LOCALES, index=0, key="pb_locale")
+            pb_due_date = st.date_input("Project Start Date", value=default_dates[7], key="pb_due_date")
+        with col5:
+            pb_valid_till = st.date_input("Valid Till", value=default_dates[30], key="pb_valid_till")
+
+        _section_header("Project Requirement")
+        pb_requirement = st.text_area(
+            "Describe the project in detail (AI will generate comprehensive brief)*",
+            value="Comprehensive project brief for Indigo Retail's e-commerce revamp including phased rollout and success metrics.",
+            height=150,
+            key="pb_requirement",
+            help="Include project goals, scope, deliverables, timeline expectations, and any specific requirements"
         )
 
-    st.markdown('<div class="section-header">Project Details</div>', unsafe_allow_html=True)
-
-    col3, col4, col5 = st.columns(3)
-    with col3:
-        pb_currency = st.selectbox("Currency", ["INR", "USD", "EUR", "GBP"], index=0, key="pb_currency")
-        pb_issue_date = st.date_input("Issue Date", value=date.today(), key="pb_issue_date")
-    with col4:
-        pb_locale = st.selectbox("Locale", ["en-IN", "en-US", "en-GB"], index=0, key="pb_locale")
-        pb_due_date = st.date_input("Project Start Date", value=date.today() + timedelta(days=7), key="pb_due_date")
-    with col5:
-        pb_valid_till = st.date_input("Valid Till", value=date.today() + timedelta(days=30), key="pb_valid_till")
-
-    st.markdown('<div class="section-header">Project Requirement</div>', unsafe_allow_html=True)
-    pb_requirement = st.text_area(
-        "Describe the project in detail (AI will generate comprehensive brief)*",
-        value="Comprehensive project brief for Indigo Retail's e-commerce revamp including phased rollout and success metrics.",
-        height=150,
-        key="pb_requirement",
-        help="Include project goals, scope, deliverables, timeline expectations, and any specific requirements"
-    )
-
-    st.markdown('<div class="section-header">Engagement Terms</div>', unsafe_allow_html=True)
-
-    pb_engagement_col1, pb_engagement_col2 = st.columns(2)
-    with pb_engagement_col1:
-        pb_payment_mode = st.selectbox(
-            "Payment Mode",
-            ["MILESTONE", "HOURLY", "FIXED_PRICE", "RETAINER"],
-            index=0,
-            key="pb_payment_mode"
-        )
-    with pb_engagement_col2:
-        pb_payment_instructions = st.text_input(
-            "Payment Instructions",
-            value="Billing aligned to milestone completion",
-            key="pb_payment_instructions"
+        _section_header("Engagement Terms")
+
+        pb_engagement_col1, pb_engagement_col2 = st.columns(2)
+        with pb_engagement_col1:
+            pb_payment_mode = st.selectbox(
+                "Payment Mode",
+                _PAYMENT_MODES,
+                index=0,
+                key="pb_payment_mode"
+            )
+        with pb_engagement_col2:
+            pb_payment_instructions = st.text_input(
+                "Payment Instructions",
+                value="Billing aligned to milestone completion",
+                key="pb_payment_instructions"
+            )
+
+        _section_header("Optional: Key Deliverables/Milestones")
+
+        pb_items = line_items_editor(
+            "items_pb",
+            [{"description": "Milestone 1", "qty": 1.0, "unit": "lot", "unit_price": 0.0}],
+            labels={"unit_price": "Estimated Value"},
+            discount=0,
+            tax_rate=0,
+            hsn_sac="",
         )
 
-    st.markdown('<div class="section-header">Optional: Key Deliverables/Milestones</div>', unsafe_allow_html=True)
-
-    pb_num_items = st.number_input("Number of deliverables", min_value=0, max_value=10, value=1, key="pb_num_items")
-
-    pb_items = []
-    for i in range(int(pb_num_items)):
-        with st.expander(f"Deliverable {i+1}", expanded=(i==0)):
-            pb_item_col1, pb_item_col2 = st.columns(2)
-            with pb_item_col1:
-                pb_desc = st.text_input("Description", value=f"Milestone {i+1}", key=f"pb_item_desc_{i}")
-                pb_qty = st.number_input("Quantity", min_value=0.0, value=1.0, key=f"pb_item_qty_{i}")
-            with pb_item_col2:
-                pb_unit = st.text_input("Unit", value="lot", key=f"pb_item_unit_{i}")
-                pb_unit_price = st.number_input("Estimated Value", min_value=0.0, value=0.0, key=f"pb_item_price_{i}")
-
-            pb_items.append({
-                "description": pb_desc,
-                "qty": pb_qty,
-                "unit": pb_unit,
-                "unit_price": pb_unit_price,
-                "discount": 0,
-                "tax_rate": 0,
-                "hsn_sac": ""
-            })
+        st.markdown("---")
 
-    st.markdown("---")
+        pb_force = st.checkbox("Force refresh (ignore cached response)", key="pb_force")
+        pb_submitted = st.form_submit_button("🚀 Generate Project Brief", type="primary", use_container_width=True)
 
-    if st.button("🚀 Generate Project Brief", type="primary", use_container_width=True, key="gen_pb_btn"):
+    if pb_submitted:
         # Build request payload
         pb_payload = {
-            "from": {
-                "name": pb_seller_name,
-                "email": pb_seller_email,
-                "phone": pb_seller_phone,
-                "gstin": pb_seller_gstin,
-                "billing_address": {
-                    "line1": pb_seller_address.split(',')[0] if ',' in pb_seller_address else pb_seller_address,
-                    "city": "Surat",
-                    "state": "Gujarat",
-                    "country": "India"
-                },
-                "tax_prefs": {
-                    "place_of_supply": "Gujarat",
-                    "reverse_charge": False,
-                    "e_invoice": False
-                }
-            },
-            "to": {
-                "name": pb_buyer_name,
-                "email": pb_buyer_email,
-                "phone": pb_buyer_phone,
-                "gstin": pb_buyer_gstin,
-                "billing_address": {
-                    "line1": pb_buyer_address.split(',')[0] if ',' in pb_buyer_address else pb_buyer_address,
-                    "city": "Mumbai",
-                    "state": "Maharashtra",
-                    "country": "India"
-                },
-                "place_of_supply": "Maharashtra"
-            },
+            "from": build_party(
+                pb_seller_name, pb_seller_email, pb_seller_phone, pb_seller_gstin, pb_seller_address, "Surat", "Gujarat",
+                tax_prefs={"place_of_supply": "Gujarat", "reverse_charge": False, "e_invoice": False},
+            ),
+            "to": build_party(
+                pb_buyer_name, pb_buyer_email, pb_buyer_phone, pb_buyer_gstin, pb_buyer_address, "Mumbai", "Maharashtra",
+                place_of_supply="Maharashtra",
+            ),
             "currency": pb_currency,
             "locale": pb_locale,
             "requirement": pb_requirement,
-            "hints": {
-                "doc_meta": {
-                    "doc_no": "",
-                    "po_no": "",
-                    "ref_no": ""
-                },
-                "dates": {
+            "hints": build_hints(
+                {"doc_no": "", "po_no": "", "ref_no": ""},
+                {
                     "issue_date": pb_issue_date.isoformat(),
                     "due_date": pb_due_date.isoformat(),
                     "valid_till": pb_valid_till.isoformat()
                 },
-                "items": pb_items if pb_num_items > 0 else [],
-                "terms": {
+                pb_items,
+                {"mode": pb_payment_mode, "instructions": pb_payment_instructions, "upi_deeplink": ""},
+                terms={
                     "title": "Engagement Notes",
                     "bullets": [
                         "Weekly progress reviews",
                         "Final acceptance on UAT sign-off"
                     ]
                 },
-                "payment": {
-                    "mode": pb_payment_mode,
-                    "instructions": pb_payment_instructions,
-                    "upi_deeplink": ""
-                }
-            }
-        }
-
-        headers = {
-            "X-Provider": st.session_state.provider,
-            "X-Model": st.session_state.model
+            ),
         }
 
+        on_item, progress = item_progress()
         with st.spinner("🤖 Generating project brief with AI..."):
-            response, error = make_request("/v1/generate/project-brief", method="POST", data=pb_payload, headers=headers)
+            response, error = cached_generate("/v1/generate/project-brief", pb_payload, force_refresh=pb_force, on_item=on_item)
+            progress.empty()
 
             if error:
                 st.error(f"❌ Error: {error}")
@@ -683,16 +866,15 @@ with tab3:
 
 # Tab 4: View Last Response
 with tab4:
-    st.markdown('<div class="section-header">Last API Response</div>', unsafe_allow_html=True)
+    _section_header("Last API Response")
     
-    if st.session_state.last_response:
-        st.json(st.session_state.last_response)
+    if st.session_state.last_response_text:
+        st.json(st.session_state.last_response_text)
         
         # Download button
-        json_str = json.dumps(st.session_state.last_response, indent=2)
         st.download_button(
             label="📥 Download JSON",
-            data=json_str,
+            data=st.session_state.last_response_text,
             file_name=f"brief2bill_response_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json",
             use_container_width=True
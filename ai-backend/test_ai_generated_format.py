@@ -2,133 +2,63 @@
 
 import json
 import sys
+import traceback
 from datetime import date
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from app.models.outputs import ProjectBriefOutput
+from _test_fixtures import AI_FORMAT_FIXTURE, AI_FORMAT_JSON, BRIEF_ADAPTER, error_lines
 
 
 def test_ai_generated_format():
     """Test with the exact format the AI is currently generating."""
-    print("=" * 80)
-    print("TESTING AI-GENERATED FORMAT (start/end dates, when/percent)")
-    print("=" * 80)
-    
-    # This is the exact format the AI is generating based on the error logs
-    data = {
-        "title": "E-commerce Platform Development",
-        "objective": "Build a modern e-commerce platform",
-        "scope": [
-            "UI/UX design",
-            "Frontend development",
-            "Backend API"
-        ],
-        "deliverables": [
-            "Design mockups",
-            "Developed application",
-            "Documentation"
-        ],
-        "milestones": [
-            {
-                "name": "Discovery & Planning",
-                "start": "2025-11-04",
-                "end": "2025-11-11",
-                "fee": 0.0
-            },
-            {
-                "name": "UX Research & Wireframes",
-                "start": "2025-11-11",
-                "end": "2025-11-18",
-                "fee": 0.0
-            },
-            {
-                "name": "UI Design Approval",
-                "start": "2025-11-18",
-                "end": "2025-11-25",
-                "fee": 0.0
-            }
-        ],
-        "timeline_days": 60,
-        "billing_plan": [
-            {
-                "when": "Milestone 1",
-                "percent": 20
-            },
-            {
-                "when": "Milestone 2",
-                "percent": 20
-            },
-            {
-                "when": "Milestone 3",
-                "percent": 20
-            },
-            {
-                "when": "Milestone 4",
-                "percent": 20
-            },
-            {
-                "when": "Milestone 5",
-                "percent": 20
-            }
-        ],
-        "risks": [
-            {
-                "description": "Delay in content provision",
-                "impact": "Medium",
-                "probability": "High",
-                "mitigation": "Allocate buffer time in schedule"
-            }
-        ]
-    }
+    # Report lines are collected and written to stdout in one call
+    out = ["=" * 80, "TESTING AI-GENERATED FORMAT (start/end dates, when/percent)", "=" * 80]
     
     try:
         # Validate using Pydantic model
-        brief = ProjectBriefOutput.model_validate(data, strict=False)
+        brief = BRIEF_ADAPTER.validate_json(AI_FORMAT_JSON, strict=False)
         
-        print("\n✅ Validation PASSED!")
-        print(f"\n📋 Project Brief:")
-        print(f"   Title: {brief.title}")
-        print(f"   Timeline: {brief.timeline_days} days")
-        print(f"   Milestones: {len(brief.milestones)}")
+        out.append("\n✅ Validation PASSED!")
+        out.append(f"\n📋 Project Brief:")
+        out.append(f"   Title: {brief.title}")
+        out.append(f"   Timeline: {brief.timeline_days} days")
+        out.append(f"   Milestones: {len(brief.milestones)}")
         
         # Check milestone field syncing
         for i, milestone in enumerate(brief.milestones):
-            print(f"\n   Milestone {i+1}: {milestone.name}")
-            print(f"      - start: {milestone.start}")
-            print(f"      - end: {milestone.end}")
-            print(f"      - days_from_start: {milestone.days_from_start}")
+            out.append(f"\n   Milestone {i+1}: {milestone.name}")
+            out.append(f"      - start: {milestone.start}")
+            out.append(f"      - end: {milestone.end}")
+            out.append(f"      - days_from_start: {milestone.days_from_start}")
         
         # Check billing plan field syncing
-        print(f"\n   Billing Plan: {len(brief.billing_plan)} parts")
-        total = 0
+        out.append(f"\n   Billing Plan: {len(brief.billing_plan)} parts")
         for i, bp in enumerate(brief.billing_plan):
-            print(f"\n   Part {i+1}:")
-            print(f"      - when: {bp.when}")
-            print(f"      - percent: {bp.percent}")
-            print(f"      - milestone: {bp.milestone}")
-            print(f"      - percentage: {bp.percentage}")
-            total += bp.percentage if bp.percentage else 0
+            out.append(f"\n   Part {i+1}:")
+            out.append(f"      - when: {bp.when}")
+            out.append(f"      - percent: {bp.percent}")
+            out.append(f"      - milestone: {bp.milestone}")
+            out.append(f"      - percentage: {bp.percentage}")
         
-        print(f"\n   Total billing: {total}%")
+        total = sum(bp.percent for bp in AI_FORMAT_FIXTURE["billing_plan"])
+        out.append(f"\n   Total billing: {total}%")
         
         # Check risks
-        print(f"\n   Risks: {len(brief.risks) if brief.risks else 0}")
+        out.append(f"\n   Risks: {len(brief.risks) if brief.risks else 0}")
         if brief.risks:
             for i, risk in enumerate(brief.risks):
-                print(f"\n   Risk {i+1}:")
-                print(f"      - Description: {risk.description}")
-                print(f"      - Impact: {risk.impact}")
-                print(f"      - Probability: {risk.probability}")
+                out.append(f"\n   Risk {i+1}:")
+                out.append(f"      - Description: {risk.description}")
+                out.append(f"      - Impact: {risk.impact}")
+                out.append(f"      - Probability: {risk.probability}")
         
+        sys.stdout.write("\n".join(out) + "\n")
         return True
         
     except Exception as e:
-        print(f"\n❌ Validation FAILED!")
-        print(f"   Error: {e}")
-        import traceback
+        out.append(f"\n❌ Validation FAILED!")
+        out.extend(error_lines(e))
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         traceback.print_exc()
         return False
 
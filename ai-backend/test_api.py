@@ -1,55 +1,82 @@
 """Quick API test script."""
 
-import json
+import asyncio
+import os
 
+import httpx
+import orjson
 import pytest
 
-try:  # pragma: no cover - optional dependency for manual tests
-    import requests
-except ModuleNotFoundError:  # pragma: no cover - keep skipped tests importable without requests
-    requests = None  # type: ignore[assignment]
+try:  # HTTP/2 needs the optional h2 package (installed via httpx[http2])
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
 
 
 pytestmark = pytest.mark.skip("Manual integration tests that require a running server")
 
 BASE_URL = "http://127.0.0.1:8000"
 
-def test_health():
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# The draft probe needs at least one non-empty provider key in the environment
+_HAS_KEY = any(os.environ[name] for name in {"OPENAI_API_KEY", "OPENROUTER_API_KEY", "GROQ_API_KEY"} & os.environ.keys())
+
+# Provider names fetched by test_providers, reused by test_provider_models
+_PROVIDER_CACHE: list[str] | None = None
+
+
+async def _post_json(client, path, payload):
+    """POST ``payload`` encoded with orjson rather than httpx's stdlib json."""
+    return await client.post(path, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+
+
+def _dump(data):
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+async def test_health(client):
     """Test health endpoint"""
-    response = requests.get(f"{BASE_URL}/v1/health")
+    response = await client.get("/v1/health")
     print(f"Health: {response.status_code}")
-    print(json.dumps(response.json(), indent=2))
+    print(_dump(orjson.loads(response.content)))
     print()
 
-def test_version():
+async def test_version(client):
     """Test version endpoint"""
-    response = requests.get(f"{BASE_URL}/v1/version")
+    response = await client.get("/v1/version")
     print(f"Version: {response.status_code}")
-    print(json.dumps(response.json(), indent=2))
+    print(_dump(orjson.loads(response.content)))
     print()
 
-def test_providers():
+async def test_providers(client):
     """Test providers endpoint"""
-    response = requests.get(f"{BASE_URL}/v1/providers")
+    response = await client.get("/v1/providers")
     print(f"Providers: {response.status_code}")
-    providers = response.json()  # Now returns a list of provider names directly
+    providers = orjson.loads(response.content)  # Now returns a list of provider names directly
+    global _PROVIDER_CACHE
+    _PROVIDER_CACHE = providers
     print(f"Enabled providers: {providers}")
     print()
 
-def test_provider_models():
+async def test_provider_models(client):
     """Test provider models endpoint"""
-    # First get list of providers
-    response = requests.get(f"{BASE_URL}/v1/providers")
-    providers = response.json()
+    # First get list of providers, unless test_providers already fetched it
+    providers = _PROVIDER_CACHE
+    if providers is None:
+        response = await client.get("/v1/providers")
+        providers = orjson.loads(response.content)
 
     if providers:
         # Test models endpoint for first provider
         provider_name = providers[0]
-        response = requests.get(f"{BASE_URL}/v1/providers/{provider_name}/models")
+        response = await client.get(f"/v1/providers/{provider_name}/models")
         print(f"Models for {provider_name}: {response.status_code}")
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"Provider: {data.get('provider')}")
             models = data.get('models', [])
             print(f"Found {len(models)} models")
@@ -59,7 +86,7 @@ def test_provider_models():
             print(f"Error: {response.text}")
     print()
 
-def test_draft():
+async def test_draft(client):
     """Test draft generation endpoint"""
     payload = {
         "prompt": "Create a quotation for web development services: 3 pages at 15000 each, SEO optimization 10000, hosting setup 5000. Client is ABC Corp, seller is XYZ Solutions.",
@@ -73,11 +100,11 @@ def test_draft():
     print("Testing draft generation...")
     print(f"Prompt: {payload['prompt']}")
     
-    response = requests.post(f"{BASE_URL}/v1/draft", json=payload)
+    response = await _post_json(client, "/v1/draft", payload)
     print(f"Draft: {response.status_code}")
     
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"Generated {len(data.get('drafts', []))} draft(s)")
         if data.get('drafts'):
             draft = data['drafts'][0]
@@ -88,7 +115,7 @@ def test_draft():
         print(f"Error: {response.text}")
     print()
 
-def test_validate():
+async def test_validate(client):
     """Test validation endpoint"""
     # Create a minimal valid bundle
     bundle = {
@@ -120,30 +147,33 @@ def test_validate():
         ]
     }
     
-    response = requests.post(f"{BASE_URL}/v1/validate", json={"bundle": bundle})
+    response = await _post_json(client, "/v1/validate", {"bundle": bundle})
     print(f"Validate: {response.status_code}")
-    data = response.json()
+    data = orjson.loads(response.content)
     print(f"Valid: {data.get('ok')}")
     if not data.get('ok'):
         print(f"Errors: {len(data.get('errors', []))}")
     print()
 
-if __name__ == "__main__":
-    if requests is None:
-        raise SystemExit("The 'requests' library is required for these manual integration tests.")
-
+async def main():
     print("=== Brief2Bill API Tests ===\n")
 
-    test_health()
-    test_version()
-    test_providers()
-    test_validate()
-
-    # Only test draft if we have an API key
-    import os
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=_HTTP2_AVAILABLE, timeout=60.0) as client:
+        # The probes are independent, so their round trips overlap
+        await asyncio.gather(
+            test_health(client),
+            test_version(client),
+            test_providers(client),
+            test_validate(client),
+        )
+        await test_provider_models(client)
+
+        # Only test draft if we have an API key
+        if _HAS_KEY:
+            await test_draft(client)
+        else:
+            print("Skipping draft test - no API keys configured")
 
-    if os.getenv("OPENAI_API_KEY") or os.getenv("OPENROUTER_API_KEY") or os.getenv("GROQ_API_KEY"):
-        test_draft()
-    else:
-        print("Skipping draft test - no API keys configured")
 
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,16 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "ai-backend"))
+from app.core.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def isolated_model_cache(tmp_path, monkeypatch):
+    # Keep the on-disk model catalogue cache out of the developer's home directory
+    monkeypatch.setenv("MODELS_CACHE_DIR", str(tmp_path / "models"))
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "ai-backend"))
+from app.providers.base import LLMProvider, LLMRawResponse, ProviderCapabilities, PromptPacket
+from app.services.drafting_service import DraftingService
+from app.services.validation import ValidationService
+
+
+class CountingProvider(LLMProvider):
+    def __init__(self):
+        super().__init__("test")
+        self.calls = 0
+
+    async def generate(self, prompt: PromptPacket) -> LLMRawResponse:
+        self.calls += 1
+        bundle = {
+            "drafts": [
+                {
+                    "doc_type": "QUOTATION",
+                    "seller": {"name": "Seller"},
+                    "buyer": {"name": "Buyer"},
+                    "dates": {"issue_date": "2024-01-01"},
+                    "items": [{"description": "Work", "qty": 1, "unit_price": 100}],
+                    "totals": {
+                        "subtotal": 100,
+                        "discount_total": 0,
+                        "tax_total": 0,
+                        "grand_total": 100,
+                        "round_off": 0,
+                    },
+                    "currency": "INR",
+                }
+            ]
+        }
+        return LLMRawResponse(content=json.dumps(bundle), model=prompt.model, provider="stub")
+
+    def capabilities(self) -> ProviderCapabilities:
+        return ProviderCapabilities(supports_plain_json=True)
+
+    async def list_models(self):
+        return []
+
+
+def test_generate_bundle_reuses_cached_response():
+    service = DraftingService(ValidationService())
+    provider = CountingProvider()
+
+    first = asyncio.run(service.generate_bundle(provider, "stub-model", "Website revamp"))
+    first["drafts"][0]["buyer"]["name"] = "Mutated"
+    second = asyncio.run(service.generate_bundle(provider, "stub-model", "Website revamp"))
+
+    assert provider.calls == 1
+    assert second["drafts"][0]["buyer"]["name"] == "Buyer"
+
+    asyncio.run(service.generate_bundle(provider, "stub-model", "Mobile app"))
+    assert provider.calls == 2
+
+
+class SectionProvider(CountingProvider):
+    def __init__(self):
+        super().__init__()
+        self.schemas = []
+
+    async def generate(self, prompt: PromptPacket) -> LLMRawResponse:
+        self.calls += 1
+        schema = prompt.response_format["json_schema"]["schema"]
+        self.schemas.append(schema)
+        doc_type = schema["$defs"]["DocDraft"]["properties"]["doc_type"]["enum"][0]
+        draft = {
+            "doc_type": doc_type,
+            "seller": {"name": "Seller"},
+            "buyer": {"name": "Buyer"},
+            "dates": {"issue_date": "2024-01-01"},
+            "items": [{"description": "Work", "qty": 1, "unit_price": 100}],
+            # Deliberately stale totals; the merged bundle must be repaired
+            "totals": {"subtotal": 0, "discount_total": 0, "tax_total": 0, "grand_total": 0, "round_off": 0},
+            "currency": "INR",
+        }
+        return LLMRawResponse(content=json.dumps({"drafts": [draft]}), model=prompt.model, provider="stub")
+
+    def capabilities(self) -> ProviderCapabilities:
+        return ProviderCapabilities(supports_json_schema=True)
+
+
+def test_generate_bundle_parallel_issues_one_narrow_call_per_doc_type():
+    service = DraftingService(ValidationService())
+    provider = SectionProvider()
+
+    bundle = asyncio.run(
+        service.generate_bundle_parallel(
+            provider, "stub-model", "Website revamp", doc_types=["QUOTATION", "TAX_INVOICE"]
+        )
+    )
+
+    assert provider.calls == 2
+    assert sorted(d["doc_type"] for d in bundle["drafts"]) == ["QUOTATION", "TAX_INVOICE"]
+    assert all(s["properties"]["drafts"]["maxItems"] == 1 for s in provider.schemas)
+    assert all("ProjectBrief" not in s["$defs"] for s in provider.schemas)
+    assert all(d["totals"]["grand_total"] == 100 for d in bundle["drafts"])
+
+    asyncio.run(
+        service.generate_bundle_parallel(
+            provider, "stub-model", "Website revamp", doc_types=["TAX_INVOICE", "QUOTATION"]
+        )
+    )
+    assert provider.calls == 2
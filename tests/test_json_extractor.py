@@ -0,0 +1,32 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "ai-backend"))
+from app.utils.json_extractor import extract_json, find_json_object
+
+
+def test_find_json_object_handles_nesting_and_strings():
+    text = 'Here you go: {"a": {"b": "}{"}, "c": "say \\"hi\\""} trailing {"x": 1}'
+    assert find_json_object(text) == '{"a": {"b": "}{"}, "c": "say \\"hi\\""}'
+
+
+def test_find_json_object_returns_none_when_unbalanced():
+    assert find_json_object("no json here") is None
+    assert find_json_object('{"a": {"b": 1}') is None
+
+
+def test_extract_json_prefers_first_balanced_object():
+    text = 'prefix {"doc": {"total": 10}} and later {"other": true}'
+    assert extract_json(text) == {"doc": {"total": 10}}
+
+
+def test_extract_json_prefers_fence_over_braces_in_prose():
+    text = 'Pick one of {a, b}. Here it is:\n```json\n{"doc": {"total": 10}}\n```'
+    assert extract_json(text) == {"doc": {"total": 10}}
+
+
+def test_extract_json_raises_without_object():
+    with pytest.raises(ValueError):
+        extract_json("plain text")
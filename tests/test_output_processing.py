@@ -0,0 +1,47 @@
+import copy
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "ai-backend"))
+from app.models.generation import GenerationRequest
+from app.services.output_processing import _normalise_billing_plan, build_invoice_output
+
+
+def _request():
+    return GenerationRequest.model_validate(
+        {
+            "to": {"name": "Client Co"},
+            "from": {"name": "Acme Pvt Ltd"},
+            "requirement": "Monthly retainer",
+            "hints": {"payment": {"mode": "BANK_TRANSFER", "instructions": "NEFT only"}},
+        }
+    )
+
+
+def test_build_invoice_output_leaves_raw_untouched():
+    raw = {
+        "doc_meta": {},
+        "dates": {"issue_date": "2024-02-01"},
+        "items": [{"description": "Retainer", "qty": 1, "unit_price": 25000, "tax_rate": 18}],
+        "payment": {},
+    }
+    snapshot = copy.deepcopy(raw)
+
+    model = build_invoice_output(raw, _request())
+    model.items[0].description = "Changed"
+
+    assert raw == snapshot
+    assert model.payment.mode == "BANK_TRANSFER"
+    assert model.doc_meta.doc_no.startswith("INV-")
+
+
+def test_normalise_billing_plan_uses_largest_remainder():
+    plan = _normalise_billing_plan([{"when": "A", "percent": 1}, {"when": "B", "percent": 1}, {"when": "C", "percent": 1}])
+    assert [part["percent"] for part in plan] == [34, 33, 33]
+
+    plan = _normalise_billing_plan([{"when": "Kickoff", "percent": 30}, {"percent": 0}, {"when": "Final", "percent": 60}])
+    assert [part["percent"] for part in plan] == [33, 0, 67]
+    assert plan[1]["when"] == "Milestone 2"
+
+    plan = _normalise_billing_plan([{}, {}])
+    assert [part["percent"] for part in plan] == [50, 50]
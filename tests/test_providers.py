@@ -17,3 +17,65 @@ def test_providers_list():
     assert isinstance(data["providers"], list)
     names = {provider["name"] for provider in data["providers"]}
     assert names == {"openrouter", "groq", "openai", "gemini"}
+
+
+def test_model_catalogue_survives_restart_via_disk_cache(tmp_path):
+    import asyncio
+
+    from app.core.config import Settings
+    from app.providers.base import ModelDescriptor
+    from app.services.provider_service import ProviderService
+
+    class CatalogueProvider:
+        def __init__(self, fail=False):
+            self.fail = fail
+
+        async def list_models(self):
+            if self.fail:
+                raise RuntimeError("offline")
+            return [ModelDescriptor(id="m-1", family="test")]
+
+    settings = Settings(models_cache_dir=str(tmp_path), openrouter_api_key=None, groq_api_key=None,
+                        openai_api_key=None, gemini_api_key=None, google_api_key=None)
+
+    first = ProviderService(settings, http_client=None)
+    first._providers["groq"] = CatalogueProvider()
+    asyncio.run(first._cached_model_dicts("groq"))
+    assert (tmp_path / "groq.json").exists()
+
+    second = ProviderService(settings, http_client=None)
+    second._providers["groq"] = CatalogueProvider(fail=True)
+    second._load_disk_cache()
+    models = asyncio.run(second._cached_model_dicts("groq"))
+    assert [model["id"] for model in models] == ["m-1"]
+
+
+def test_fallback_catalogue_is_not_cached_over_real_models(tmp_path):
+    import asyncio
+
+    from app.core.config import Settings
+    from app.providers.base import FallbackModelList, ModelDescriptor
+    from app.services.provider_service import ProviderService
+
+    class FlakyProvider:
+        def __init__(self):
+            self.fallback = False
+
+        async def list_models(self):
+            if self.fallback:
+                return FallbackModelList([ModelDescriptor(id="static", family="test")])
+            return [ModelDescriptor(id="live", family="test")]
+
+    settings = Settings(models_cache_dir=str(tmp_path), models_cache_ttl_seconds=0, openrouter_api_key=None,
+                        groq_api_key=None, openai_api_key=None, gemini_api_key=None, google_api_key=None)
+    service = ProviderService(settings, http_client=None)
+    provider = FlakyProvider()
+    service._providers["groq"] = provider
+
+    asyncio.run(service._cached_model_dicts("groq"))
+    provider.fallback = True
+    models = asyncio.run(service._cached_model_dicts("groq"))
+
+    assert [model["id"] for model in models] == ["live"]
+    assert [model["id"] for model in service._models_cache["groq"][1]] == ["live"]
+    assert b"live" in (tmp_path / "groq.json").read_bytes()